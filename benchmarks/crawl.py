@@ -0,0 +1,154 @@
+"""
+Сквозной прогон HTTP-парсера на синтетическом архиве.
+
+Поднимает локальный сервер с архивом заданного размера, выполняет полный
+обход во временный каталог и временную БД и выводит пропускную способность,
+задержку записи в БД и пиковое потребление памяти.
+
+    python -m benchmarks.crawl --links 500 --size 1048576
+"""
+
+import argparse
+import asyncio
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks.fake_fshow import FakeArchive, FakeServer
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Нагрузочный прогон парсера")
+    parser.add_argument("--links", type=int, default=200, help="Число выпусков в архиве")
+    parser.add_argument(
+        "--size", type=int, default=256 * 1024, help="Размер аудиофайла, байт"
+    )
+    parser.add_argument(
+        "--latency", type=float, default=0, help="Задержка ответа сервера, с"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=None, help="Одновременных загрузок"
+    )
+    parser.add_argument(
+        "--rate",
+        type=float,
+        default=1000,
+        help="Начальная и предельная частота запросов к серверу, в секунду",
+    )
+    return parser.parse_args()
+
+
+def configure_environment(workdir: Path) -> None:
+    """Настройки приложения для прогона: временная БД вместо рабочей."""
+    os.environ["DB_URI"] = f"sqlite+aiosqlite:///{workdir / 'benchmark.sqlite3'}"
+    os.environ.setdefault("TOKEN", "0:benchmark")
+    os.environ.setdefault("ADMIN_CHAT_ID", "0")
+
+
+def track_db_writes(engine) -> list[float]:
+    """Замер длительности каждого INSERT в БД."""
+    from sqlalchemy import event
+
+    durations: list[float] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def before(conn, cursor, statement, parameters, context, executemany):
+        conn.info["query_start"] = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def after(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("INSERT"):
+            durations.append(time.perf_counter() - conn.info.pop("query_start"))
+
+    return durations
+
+
+async def run(args: argparse.Namespace, workdir: Path) -> dict[str, float]:
+    # приложение импортируется после подмены настроек окружения
+    from src.core.config import settings
+    from src.database.connect import engine, write_engine
+    from src.database.models import Base
+    from src.services.downloader import HttpDownloader
+    from src.services.journal import CrawlJournal
+    from src.services.ratelimit import HostLimiter
+    from src.utils.parser import HttpPageParser
+
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    # на SQLite записи идут через отдельное соединение очереди записи
+    db_writes = track_db_writes(write_engine)
+
+    directory = workdir / "broadcasts"
+    limiter = HostLimiter(
+        settings.PARSER.HOST_CONCURRENCY, rate=args.rate, max_rate=args.rate
+    )
+    archive = FakeArchive(args.links, args.size, args.latency)
+
+    async with FakeServer(archive) as server:
+        start_time = time.perf_counter()
+        with CrawlJournal(workdir / "parser.journal") as journal:
+            async with HttpDownloader(
+                directory,
+                concurrency=args.concurrency or settings.PARSER.CONCURRENCY,
+                limiter=limiter,
+            ) as downloader:
+                parser = HttpPageParser(
+                    downloader, journal, start_url=server.start_url, incremental=False
+                )
+                await parser.parse_page()
+        elapsed = time.perf_counter() - start_time
+
+    await engine.dispose()
+    await write_engine.dispose()
+    files = [entry for entry in os.scandir(directory) if entry.is_file()]
+    return {
+        "elapsed": elapsed,
+        "links": len(files),
+        "bytes": sum(entry.stat().st_size for entry in files),
+        "db_writes": db_writes,
+    }
+
+
+def report(args: argparse.Namespace, result: dict) -> None:
+    """Вывод результатов прогона."""
+    elapsed, db_writes = result["elapsed"], result["db_writes"]
+    # ru_maxrss в Linux - в килобайтах, в macOS - в байтах
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_rss_mb = peak_rss / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+    lines = [
+        f"Архив:             {args.links} выпусков по {args.size} байт",
+        f"Загружено:         {result['links']} файлов за {elapsed:.2f} с",
+        f"Ссылок в секунду:  {result['links'] / elapsed:.1f}",
+        f"Байт в секунду:    {result['bytes'] / elapsed / 1024 / 1024:.2f} МБ/с",
+    ]
+    if db_writes:
+        db_writes_ms = sorted(duration * 1000 for duration in db_writes)
+        p95 = (
+            statistics.quantiles(db_writes_ms, n=20, method="inclusive")[-1]
+            if len(db_writes_ms) > 1
+            else db_writes_ms[0]
+        )
+        lines.append(
+            f"Запись в БД:       {len(db_writes_ms)} пакетов, "
+            f"среднее {statistics.mean(db_writes_ms):.2f} мс, "
+            f"p95 {p95:.2f} мс, макс. {db_writes_ms[-1]:.2f} мс"
+        )
+    lines.append(f"Пиковая память:    {peak_rss_mb:.1f} МБ")
+    print("\n".join(lines))
+
+
+def main() -> None:
+    args = parse_args()
+    with tempfile.TemporaryDirectory(prefix="franky-bench-") as workdir:
+        configure_environment(Path(workdir))
+        result = asyncio.run(run(args, Path(workdir)))
+    report(args, result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+import asyncio
+from datetime import date, timedelta
+from typing import Optional
+
+from aiohttp import web
+
+RELEASE_TYPES = ("", "(фрагмент) ", "(праздник) ")
+
+
+class FakeArchive:
+    """
+    Синтетический архив в разметке fshow.info.
+
+    Главная страница с кнопкой показа ролей, страницы выпусков с кодом
+    подтверждения и загрузка аудио с поддержкой докачки (Range).
+    """
+
+    def __init__(self, links: int, payload_size: int, latency: float = 0):
+        self.links = links
+        self.latency = latency
+        self.payload = b"\xff\xfb\x90\x00" + bytes(range(256)) * (payload_size // 256)
+        self.payload = self.payload[:payload_size]
+
+    def link_text(self, index: int) -> str:
+        """Текст ссылки на выпуск в формате сайта."""
+        if index % 50 == 49:
+            return f"={2000 + index % 20}= Роль {index}"
+        release_date = date(2010, 1, 1) + timedelta(days=index)
+        release_type = RELEASE_TYPES[index % len(RELEASE_TYPES)]
+        return f"{release_date:%d.%m.%y} {release_type}Роль {index}"
+
+    def app(self) -> web.Application:
+        """Приложение aiohttp с маршрутами сайта."""
+        app = web.Application()
+        app.router.add_get("/index.php", self.index)
+        app.router.add_get("/get.php", self.code_page)
+        app.router.add_post("/dl.php", self.audio)
+        return app
+
+    async def index(self, request: web.Request) -> web.Response:
+        await self._delay()
+        if "show" not in request.query:
+            return _html(
+                '<form action="index.php" method="get">'
+                '<input type="hidden" name="all" value="">'
+                '<input type="submit" name="show" value="Показать роли"></form>'
+            )
+        links = "".join(
+            f'<a href="get.php?id={index}">{self.link_text(index)}</a><br>\n'
+            for index in range(self.links)
+        )
+        return _html(f'<form id="list">{links}</form>')
+
+    async def code_page(self, request: web.Request) -> web.Response:
+        await self._delay()
+        index = request.query["id"]
+        return _html(
+            f'<div id="nekto">{_code(index)}</div>'
+            '<form method="post" action="dl.php">'
+            f'<input type="hidden" name="id" value="{index}">'
+            '<input name="code"><input type="submit" value="Скачать"></form>'
+        )
+
+    async def audio(self, request: web.Request) -> web.StreamResponse:
+        await self._delay()
+        data = await request.post()
+        if data.get("code") != _code(data.get("id", "")):
+            return _html("Неверный код")
+
+        start = 0
+        if ranges := request.http_range:
+            start = ranges.start or 0
+        response = web.StreamResponse(
+            status=206 if start else 200,
+            headers={
+                "Content-Type": "audio/mpeg",
+                "Content-Disposition": f'attachment; filename="role_{data["id"]}.mp3"',
+                "Content-Length": str(len(self.payload) - start),
+            },
+        )
+        await response.prepare(request)
+        await response.write(self.payload[start:])
+        return response
+
+    async def _delay(self) -> None:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+
+class FakeServer:
+    """Запуск синтетического архива на локальном порту."""
+
+    def __init__(self, archive: FakeArchive, host: str = "127.0.0.1", port: int = 0):
+        self.archive = archive
+        self.host = host
+        self.port = port
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def start_url(self) -> str:
+        return f"http://{self.host}:{self.port}/index.php?all"
+
+    async def __aenter__(self) -> "FakeServer":
+        self._runner = web.AppRunner(self.archive.app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        self.port = site._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self._runner.cleanup()
+
+
+def _code(index: str) -> str:
+    return f"k{int(index) * 7919 % 100000:05d}"
+
+
+def _html(body: str) -> web.Response:
+    return web.Response(text=f"<html><body>{body}</body></html>", content_type="text/html")
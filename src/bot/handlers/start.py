@@ -22,7 +22,11 @@ from src.bot.utils.callback_data import UserSettingsCallback
 from src.bot.utils.send_message import notify_admin
 from src.bot.utils.states import StateUserActions
 from src.core.config import settings
-from src.core.constants import DEFAULT_AUDIO_TITLE, DEFAULT_AUDIO_PERFORMER
+from src.core.constants import (
+    DEFAULT_AUDIO_TITLE,
+    DEFAULT_AUDIO_PERFORMER,
+    MAX_SEND_ATTEMPTS,
+)
 from src.core.exceptions import AudioServiceException
 from src.core.logger import logger
 from src.core.paths import BROADCASTS_DIR
@@ -30,6 +34,7 @@ from src.database.models.broadcast import Broadcast
 from src.database.models.user import User
 from src.database.repo.requests import RequestsRepo
 from src.services.audio import AudioService
+from src.services.shuffle import ShuffleBag
 
 router = Router()
 
@@ -37,7 +42,7 @@ router = Router()
 @router.message(CommandStart())
 async def command_start_handler(
     message: Message,
-    repo: RequestsRepo,
+    user: User,
     i18n: TranslatorRunner,
 ) -> None:
 
@@ -56,29 +61,28 @@ async def command_show_handler(
     Хендлер обработки команды '/show'
     Отправляет пользователю аудиофайл с выпуском
     """
-    while True:
-        broadcast = await repo.broadcasts.get_random_broadcast()
-        service = AudioService(user, broadcast, repo, message.bot)
+    for _ in range(MAX_SEND_ATTEMPTS):
+        broadcast = await ShuffleBag(user, repo).next()
         if not broadcast:
             await message.answer(i18n.info.no_broadcasts())
             logger.info("Запрос случайного выпуска. База данных пуста")
             return
-        print(broadcast.id)
+        service = AudioService(user, broadcast, repo, message.bot)
         try:
             async with ChatActionSender.upload_voice(
                 chat_id=message.chat.id, bot=message.bot
             ):
-
                 result = await service.send_audio()
-                print(result.audio.file_id)
                 if result:
                     await state.update_data(broadcast=broadcast)
                     if not user.show_role_name:
                         await state.set_state(StateUserActions.listen)
-                    break
+                    return
         except Exception as e:
             logger.error(f"Failed to send audio: {str(e)}")
-            continue
+
+    logger.error(f"Выпуск не отправлен после {MAX_SEND_ATTEMPTS} попыток")
+    await message.answer(i18n.unknown.error())
 
 
 @router.message(Command("test"))
@@ -110,7 +114,7 @@ async def edit_settings_callback(
     user: User,
     i18n: TranslatorRunner,
 ) -> None:
-    await repo.users.update(
+    await repo.users.update_user(
         user, update_data={"show_role_name": callback_data.show_role_name}
     )
     await callback.answer(text=i18n.settings.saved(), show_alert=True)
@@ -118,11 +122,7 @@ async def edit_settings_callback(
 
 
 @router.callback_query(F.data == "back")
-async def back_callback(
-    callback: CallbackQuery,
-    repo: RequestsRepo,
-    user: User,
-) -> None:
+async def back_callback(callback: CallbackQuery) -> None:
     await callback.message.delete()
 
 
@@ -1,15 +1,29 @@
 from typing import Any, Awaitable, Callable, Dict
 
 from aiogram import BaseMiddleware
-from aiogram.types import TelegramObject
+from aiogram.dispatcher.event.handler import HandlerObject
+from aiogram.types import TelegramObject, User as TelegramUser
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.database.models.user import User
 from src.database.repo.requests import RequestsRepo
+from src.services.user_cache import user_cache
 
 
 class DatabaseMiddleware(BaseMiddleware):
     """
     Интеграция подключения к базе данных в хендлеры бота
     и предоставляет данные о пользователе из базы в хендлеры.
+
+    Подключается как внутренняя миддлварь, когда хендлер уже выбран:
+    `repo` и `user` передаются только хендлерам, которые их объявляют.
+    Сессия создается лишь для таких хендлеров и закрывается сразу после них,
+    а соединение берется из пула при первом запросе к БД, поэтому
+    пользователь из кэша не занимает соединение вовсе.
+    Хранилища работают в режиме единицы работы: все изменения хендлера
+    откладываются и фиксируются одной транзакцией после его успешного
+    завершения, поэтому транзакция записи не держится, пока хендлер ждет
+    Telegram. Новый пользователь записывается до вызова хендлера.
     """
 
     def __init__(self, session_pool) -> None:
@@ -21,20 +35,45 @@ class DatabaseMiddleware(BaseMiddleware):
         event: TelegramObject,
         data: Dict[str, Any],
     ) -> Any:
+        handler_object: HandlerObject = data["handler"]
+        needs_repo = handler_object.varkw or "repo" in handler_object.params
+        needs_user = handler_object.varkw or "user" in handler_object.params
+        event_from_user = data.get("event_from_user")
+        if not needs_repo and not (needs_user and event_from_user):
+            return await handler(event, data)
+
         async with self.session_pool() as session:
-            repo = RequestsRepo(session)
-            event_from_user = data.get("event_from_user")
-            if not event_from_user:
-                return await handler(event, data)
+            if needs_user and event_from_user:
+                data["user"] = await self._get_user(session, event_from_user)
+            repo = RequestsRepo(session, autocommit=False)
+            if needs_repo:
+                data["repo"] = repo
+
+            try:
+                result = await handler(event, data)
+                await repo.commit()
+            except BaseException:
+                # изменения откатываются, в кэше не должно остаться их следов
+                if event_from_user:
+                    user_cache.discard(event_from_user.id)
+                raise
+        return result
 
-            user = await repo.users.get_or_create_user(
+    @staticmethod
+    async def _get_user(session: AsyncSession, event_from_user: TelegramUser) -> User:
+        """
+        Пользователь из кэша; запись в БД только для нового или при смене имени,
+        она фиксируется сразу, вне единицы работы хендлера.
+        """
+        user = user_cache.get(event_from_user.id)
+        if user is None or (user.first_name, user.last_name) != (
+            event_from_user.first_name,
+            event_from_user.last_name,
+        ):
+            user = await RequestsRepo(session).users.get_or_create_user(
                 telegram_id=event_from_user.id,
                 first_name=event_from_user.first_name,
                 last_name=event_from_user.last_name,
             )
-
-            data["repo"] = repo
-            data["user"] = user
-
-            result = await handler(event, data)
-        return result
+            user_cache.put(user)
+        return user
@@ -4,7 +4,7 @@ from aiogram import BaseMiddleware
 from aiogram.types import TelegramObject
 from fluentogram import TranslatorRunner
 
-from src.utils.fluent import configure_fluent, FluentService
+from src.utils.fluent import FluentService, fluent
 
 
 class LangMiddleware(BaseMiddleware):
@@ -14,6 +14,9 @@ class LangMiddleware(BaseMiddleware):
     что позволяет легко локализовать ответы и взаимодействие с ботом.
     """
 
+    def __init__(self, fluent_service: FluentService = fluent) -> None:
+        self.fluent = fluent_service
+
     async def __call__(
         self,
         handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
@@ -21,9 +24,8 @@ class LangMiddleware(BaseMiddleware):
         data: Dict[str, Any],
     ) -> Any:
         event_from_user = data.get("event_from_user")
-        fluent: FluentService = configure_fluent()
-        translator_runner: TranslatorRunner = fluent.get_translator_by_locale(
-            event_from_user.language_code
+        translator_runner: TranslatorRunner = self.fluent.get_translator_by_locale(
+            event_from_user.language_code if event_from_user else None
         )
         data["i18n"] = translator_runner
         return await handler(event, data)
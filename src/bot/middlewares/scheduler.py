@@ -0,0 +1,235 @@
+import asyncio
+import heapq
+import itertools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator, Optional, Union
+
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+)
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import (
+    CopyMessage,
+    EditMessageCaption,
+    EditMessageMedia,
+    EditMessageText,
+    ForwardMessage,
+    Response,
+    SendAnimation,
+    SendAudio,
+    SendDocument,
+    SendMediaGroup,
+    SendMessage,
+    SendPhoto,
+    SendSticker,
+    SendVideo,
+    SendVoice,
+    TelegramMethod,
+)
+from aiogram.methods.base import TelegramType
+
+from src.core.constants import (
+    GLOBAL_SEND_RATE,
+    GROUP_CHAT_SEND_RATE,
+    MAX_SEND_RETRIES,
+    PRIVATE_CHAT_SEND_RATE,
+)
+from src.core.logger import logger
+from src.utils.enums import SendPriority
+
+# методы, на которые распространяются лимиты Telegram на отправку сообщений
+SCHEDULED_METHODS = (
+    SendMessage,
+    SendAudio,
+    SendVoice,
+    SendDocument,
+    SendPhoto,
+    SendVideo,
+    SendAnimation,
+    SendSticker,
+    SendMediaGroup,
+    CopyMessage,
+    ForwardMessage,
+    EditMessageText,
+    EditMessageCaption,
+    EditMessageMedia,
+)
+# предел числа чатов, для которых хранится время следующей отправки
+CHAT_SLOTS_LIMIT = 10_000
+
+send_priority: ContextVar[SendPriority] = ContextVar(
+    "send_priority", default=SendPriority.INTERACTIVE
+)
+
+
+@contextmanager
+def priority(level: SendPriority) -> Iterator[None]:
+    """Приоритет отправок, выполняемых внутри блока."""
+    token = send_priority.set(level)
+    try:
+        yield
+    finally:
+        send_priority.reset(token)
+
+
+@dataclass
+class WaitStats:
+    """Ожидание очереди отправками одного приоритета."""
+
+    count: int = 0
+    total: float = 0
+    max: float = 0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0
+
+    def add(self, wait: float) -> None:
+        self.count += 1
+        self.total += wait
+        self.max = max(self.max, wait)
+
+
+@dataclass
+class SchedulerStats:
+    """Статистика планировщика отправок."""
+
+    sent: int = 0
+    retries: int = 0
+    waits: dict[SendPriority, WaitStats] = field(
+        default_factory=lambda: {level: WaitStats() for level in SendPriority}
+    )
+
+    def __str__(self) -> str:
+        waits = ", ".join(
+            f"{level.name.lower()}: {stats.count} "
+            f"(сред. {stats.mean:.2f} с, макс. {stats.max:.2f} с)"
+            for level, stats in self.waits.items()
+        )
+        return f"отправлено {self.sent}, повторов {self.retries}; ожидание - {waits}"
+
+
+class SendScheduler(BaseRequestMiddleware):
+    """
+    Планировщик исходящих сообщений бота.
+
+    Соблюдает общий лимит Telegram и лимит на отправку в один чат
+    (правки inline-сообщений без chat_id ограничены только общим лимитом),
+    а при ответе 429 приостанавливает всю очередь на `retry_after` и повторяет отправку.
+    Из общей очереди первыми выходят отправки с более высоким приоритетом
+    (см. `priority`): ответы пользователям раньше фоновых загрузок.
+    Остальные запросы к API проходят без ожидания.
+    """
+
+    def __init__(
+        self,
+        global_rate: float = GLOBAL_SEND_RATE,
+        private_chat_rate: float = PRIVATE_CHAT_SEND_RATE,
+        group_chat_rate: float = GROUP_CHAT_SEND_RATE,
+        max_retries: int = MAX_SEND_RETRIES,
+    ):
+        self._interval = 1 / global_rate
+        self._private_chat_interval = 1 / private_chat_rate
+        self._group_chat_interval = 1 / group_chat_rate
+        self.max_retries = max_retries
+        self.stats = SchedulerStats()
+
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+        self._next_slot = 0.0
+        self._chat_slots: dict[Union[int, str], float] = {}
+        self._dispatcher: Optional[asyncio.Task] = None
+
+    @property
+    def queue_depth(self) -> int:
+        """Число отправок, ожидающих очереди."""
+        return sum(not future.done() for *_, future in self._waiters)
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        if not isinstance(method, SCHEDULED_METHODS):
+            return await make_request(bot, method)
+
+        chat_id = method.chat_id
+        attempt = 1
+        while True:
+            await self._wait_chat(chat_id)
+            await self._wait_turn(send_priority.get())
+            try:
+                response = await make_request(bot, method)
+                self.stats.sent += 1
+                return response
+            except TelegramRetryAfter as e:
+                if attempt >= self.max_retries:
+                    raise
+                self.stats.retries += 1
+                attempt += 1
+                logger.warning(
+                    f"Превышен лимит отправки в чат {chat_id}, "
+                    f"повтор через {e.retry_after} с"
+                )
+                resume_at = asyncio.get_running_loop().time() + e.retry_after
+                # лимит действует на весь бот, а не только на этот чат
+                self._next_slot = max(self._next_slot, resume_at)
+                if chat_id is not None:
+                    self._chat_slots[chat_id] = resume_at
+
+    async def _wait_chat(self, chat_id: Optional[Union[int, str]]) -> None:
+        """Ожидание очереди на отправку в чат."""
+        # у правок inline-сообщений нет chat_id
+        if chat_id is None:
+            return
+        now = asyncio.get_running_loop().time()
+        if len(self._chat_slots) > CHAT_SLOTS_LIMIT:
+            self._chat_slots = {
+                chat: slot for chat, slot in self._chat_slots.items() if slot > now
+            }
+        slot = max(now, self._chat_slots.get(chat_id, 0))
+        self._chat_slots[chat_id] = slot + self._chat_interval(chat_id)
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def _chat_interval(self, chat_id: Union[int, str]) -> float:
+        """Минимальный интервал между отправками в чат."""
+        # у групп и каналов отрицательный id или @username
+        if isinstance(chat_id, str) or chat_id < 0:
+            return self._group_chat_interval
+        return self._private_chat_interval
+
+    async def _wait_turn(self, level: SendPriority) -> None:
+        """Ожидание места в общей очереди в порядке приоритета."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        heapq.heappush(self._waiters, (level, next(self._counter), future))
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+
+        start_time = loop.time()
+        await future
+        self.stats.waits[level].add(loop.time() - start_time)
+
+    async def _dispatch(self) -> None:
+        """Выпуск отправок из очереди с общим лимитом частоты."""
+        loop = asyncio.get_running_loop()
+        while self._waiters:
+            now = loop.time()
+            if self._next_slot > now:
+                await asyncio.sleep(self._next_slot - now)
+                continue
+            *_, future = heapq.heappop(self._waiters)
+            # ожидание могло быть отменено
+            if future.done():
+                continue
+            future.set_result(None)
+            self._next_slot = now + self._interval
+
+
+scheduler = SendScheduler()
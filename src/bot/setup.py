@@ -1,3 +1,5 @@
+import asyncio
+
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
 from aiogram.types import BotCommand
@@ -5,19 +7,32 @@ from aiogram.types import BotCommand
 from src.bot.handlers.start import router
 from src.bot.middlewares.database import DatabaseMiddleware
 from src.bot.middlewares.lang import LangMiddleware
+from src.bot.middlewares.scheduler import scheduler
+from src.bot.utils.send_message import notify_admin
 from src.core.config import settings
+from src.core.constants import MISSING_FILES_REPORT_LIMIT
+from src.core.logger import logger
 from src.database.connect import async_session_pool
+from src.database.repo.requests import RequestsRepo
+from src.services.catalog import catalog
+from src.services.file_index import file_index
+from src.services.mailing import MailingService
+from src.services.warmup import FileIDWarmer
+from src.utils.fluent import fluent
 
 
 def _set_middlewares(dp: Dispatcher):
     """Подключение миддлвари к адептам"""
-    dp.update.outer_middleware(
-        DatabaseMiddleware(async_session_pool)
-    )  # передаем данные для работы с БД в хендлеры
     dp.update.outer_middleware(
         LangMiddleware()
     )  # подключаем сервис локализации и передаем в хендлер
 
+    # передаем данные для работы с БД в хендлеры, которым они нужны
+    database = DatabaseMiddleware(async_session_pool)
+    for event_name, observer in dp.observers.items():
+        if event_name != "update":
+            observer.middleware(database)
+
 
 async def _set_main_menu(bot: Bot):
     """Создание список с командами и их описанием для кнопки menu"""
@@ -30,12 +45,64 @@ async def _set_main_menu(bot: Bot):
     await bot.set_my_commands(main_menu_commands)
 
 
+async def _load_translations():
+    """Компиляция переводов и, если включено, наблюдение за их изменением"""
+    fluent.load()
+    if settings.TELEGRAM.I18N_HOT_RELOAD:
+        fluent.watch()
+
+
+async def _load_catalog():
+    """Загрузка каталога выпусков в память"""
+    async with async_session_pool() as session:
+        await catalog.load(RequestsRepo(session))
+
+
+async def _start_file_index():
+    """Построение индекса файлов и сводка по выпускам без файла"""
+    await file_index.start()
+    missing = file_index.missing(entry.filename for entry in catalog)
+    if not missing:
+        return
+    report = f"Файлы отсутствуют на сервере ({len(missing)}): " + ", ".join(
+        missing[:MISSING_FILES_REPORT_LIMIT]
+    )
+    if len(missing) > MISSING_FILES_REPORT_LIMIT:
+        report += ", ..."
+    logger.warning(report)
+    await notify_admin(text=report)
+
+
+async def _run_background_jobs(bot: Bot):
+    """Прогрев file_id выпусков, затем рассылка новых выпусков"""
+    if settings.TELEGRAM.FILE_ID_WARMUP:
+        await FileIDWarmer(bot, async_session_pool).run()
+    if settings.TELEGRAM.MAILING:
+        await MailingService(bot, async_session_pool).run()
+
+
+async def _start_background_jobs(bot: Bot, dispatcher: Dispatcher):
+    """Запуск фоновых задач бота"""
+    dispatcher["background_task"] = asyncio.create_task(_run_background_jobs(bot))
+
+
+async def _stop_background_jobs(dispatcher: Dispatcher):
+    """Остановка фоновых задач при завершении бота"""
+    if task := dispatcher.get("background_task"):
+        task.cancel()
+    file_index.stop()
+    fluent.stop()
+    logger.info(f"Планировщик отправок: {scheduler.stats}")
+
+
 def setup_bot() -> Bot:
     """Создание и настройка бота."""
-    return Bot(
+    bot = Bot(
         token=settings.TELEGRAM.TOKEN,
         default=DefaultBotProperties(parse_mode=settings.TELEGRAM.PARSE_MODE),
     )
+    bot.session.middleware(scheduler)  # лимиты Telegram на отправку
+    return bot
 
 
 def setup_dispatcher() -> Dispatcher:
@@ -43,5 +110,10 @@ def setup_dispatcher() -> Dispatcher:
     dp = Dispatcher()
     _set_middlewares(dp)
     dp.startup.register(_set_main_menu)
+    dp.startup.register(_load_translations)
+    dp.startup.register(_load_catalog)
+    dp.startup.register(_start_file_index)
+    dp.startup.register(_start_background_jobs)
+    dp.shutdown.register(_stop_background_jobs)
     dp.include_router(router)
     return dp
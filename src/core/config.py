@@ -5,6 +5,23 @@ from pydantic_core.core_schema import ValidationInfo
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from src.core.constants import (
+    START_URL,
+    DOWNLOAD_CONCURRENCY,
+    DB_BATCH_SIZE,
+    DRIVER_POOL_SIZE,
+    HOST_CONCURRENCY,
+    REQUEST_RATE,
+    MAX_REQUEST_RATE,
+    WARMUP_CONCURRENCY,
+    TRANSCODE_CODEC,
+    TRANSCODE_BITRATE,
+    TRANSCODE_EXTENSION,
+    TRANSCODE_FORMAT,
+    TRANSCODE_CONCURRENCY,
+)
+from src.utils.enums import ParserMode
+
 
 class BaseConfig(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
@@ -14,10 +31,46 @@ class TelegramBotSettings(BaseConfig):
     TOKEN: str
     PARSE_MODE: str = "HTML"
     ADMIN_CHAT_ID: int
+    FILE_ID_WARMUP: bool = True
+    WARMUP_CONCURRENCY: int = WARMUP_CONCURRENCY
+    MAILING: bool = True
+    I18N_HOT_RELOAD: bool = False
+
+
+class ParserSettings(BaseConfig):
+    model_config = SettingsConfigDict(
+        env_file=".env", env_prefix="PARSER_", extra="ignore"
+    )
+
+    START_URL: str = START_URL
+    MODE: ParserMode = ParserMode.HTTP
+    CONCURRENCY: int = DOWNLOAD_CONCURRENCY
+    INCREMENTAL: bool = True
+    BATCH_SIZE: int = DB_BATCH_SIZE
+    WORKERS: int = DRIVER_POOL_SIZE
+    HOST_CONCURRENCY: int = HOST_CONCURRENCY
+    RATE: float = REQUEST_RATE
+    MAX_RATE: float = MAX_REQUEST_RATE
+    HEADLESS: bool = True
+
+
+class TranscodeSettings(BaseConfig):
+    model_config = SettingsConfigDict(
+        env_file=".env", env_prefix="TRANSCODE_", extra="ignore"
+    )
+
+    ENABLED: bool = False
+    CODEC: str = TRANSCODE_CODEC
+    BITRATE: str = TRANSCODE_BITRATE
+    EXTENSION: str = TRANSCODE_EXTENSION
+    FORMAT: str = TRANSCODE_FORMAT
+    CONCURRENCY: int = TRANSCODE_CONCURRENCY
 
 
 class Settings(BaseConfig):
     TELEGRAM: TelegramBotSettings = Field(default_factory=TelegramBotSettings)
+    PARSER: ParserSettings = Field(default_factory=ParserSettings)
+    TRANSCODE: TranscodeSettings = Field(default_factory=TranscodeSettings)
     DB_URI: str =  "sqlite+aiosqlite:///database.sqlite3"
 
 settings = Settings()
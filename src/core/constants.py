@@ -1,9 +1,53 @@
 # парсер
 START_URL = "http://fshow.info/index.php?all"
-PAUSE_DURATION_SECONDS = 3
 DOWNLOAD_WAIT_TIMEOUT = 200
 DRIVER_TIMEOUT = 10
+DOWNLOAD_CONCURRENCY = 4
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+HTTP_TIMEOUT = 60
+DB_BATCH_SIZE = 50
+DB_WRITE_RETRIES = 3
+DRIVER_POOL_SIZE = 2
+HOST_CONCURRENCY = 4
+MAX_LINK_ATTEMPTS = 3
+REQUEST_RATE = 1.0
+MAX_REQUEST_RATE = 5.0
+MIN_REQUEST_RATE = 0.1
+SLOW_RESPONSE_SECONDS = 10
 # отправка аудиосообщений
 DEFAULT_AUDIO_TITLE = "Роль"
 DEFAULT_AUDIO_PERFORMER = "Фрэнки - Шоу"
 MAX_SEND_ATTEMPTS = 10
+# локализация: основной язык и задержка перезагрузки переводов, секунды
+ROOT_LOCALE = "ru"
+I18N_RELOAD_DELAY = 0.5
+# кэш пользователей: число записей и время жизни записи, секунды
+USER_CACHE_SIZE = 10_000
+USER_CACHE_TTL = 600
+# сколько отсутствующих файлов перечислять в уведомлении
+MISSING_FILES_REPORT_LIMIT = 20
+# период пересканирования каталога выпусков без inotify, секунды
+FILE_INDEX_RESCAN_SECONDS = 60
+# лимиты Telegram на отправку сообщений, в секунду
+GLOBAL_SEND_RATE = 30
+PRIVATE_CHAT_SEND_RATE = 1
+GROUP_CHAT_SEND_RATE = 20 / 60
+MAX_SEND_RETRIES = 3
+# рассылка новых выпусков
+MAILING_PAGE_SIZE = 500
+MAILING_MAX_EPISODES = 3
+WARMUP_CONCURRENCY = 2
+# перекодирование аудио
+TRANSCODE_CODEC = "libmp3lame"
+TRANSCODE_BITRATE = "64k"
+TRANSCODE_EXTENSION = "mp3"
+# мультиплексор ffmpeg (-f): для m4a/aac - "ipod" или "adts", для ogg/opus - "ogg"
+TRANSCODE_FORMAT = "mp3"
+TRANSCODE_CONCURRENCY = 2
+# профиль SQLite: соединения для чтения, ожидание блокировки (секунды),
+# кэш страниц (КиБ), отображение файла в память (байты), пачка очереди записи
+SQLITE_READ_POOL_SIZE = 4
+SQLITE_BUSY_TIMEOUT = 5
+SQLITE_CACHE_SIZE_KIB = 64 * 1024
+SQLITE_MMAP_SIZE = 256 * 1024 * 1024
+WRITE_BATCH_SIZE = 100
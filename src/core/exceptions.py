@@ -40,6 +40,12 @@ class DownloadTimeoutError(Exception):
     pass
 
 
+class DownloadError(Exception):
+    """Исключение, связанное с ошибками загрузки файла."""
+
+    pass
+
+
 class AudioServiceException(Exception):
     """Базовое исключение для ошибок сервиса AudioService()"""
 
@@ -50,3 +56,9 @@ class AudioFileNotFound(AudioServiceException):
     """Исключение возникает, когда аудиофайл не найден"""
 
     pass
+
+
+class TranslationError(Exception):
+    """Исключение, связанное с ошибками в файлах переводов."""
+
+    pass
@@ -8,3 +8,5 @@ LOGS_DIR = PurePath(ROOT_DIR / "logs/")
 DATA_DIR = PurePath(ROOT_DIR / "data/")
 LOCALES_DIR = PurePath(DATA_DIR / "locales/")
 BROADCASTS_DIR = PurePath(DATA_DIR / "broadcasts/")
+COMPACT_DIR_NAME = "compact"
+JOURNAL_PATH = PurePath(DATA_DIR / "parser.journal")
@@ -1,7 +1,65 @@
+from sqlalchemy import event, make_url
 from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 
 from src.core.config import settings
+from src.core.constants import (
+    SQLITE_BUSY_TIMEOUT,
+    SQLITE_CACHE_SIZE_KIB,
+    SQLITE_MMAP_SIZE,
+    SQLITE_READ_POOL_SIZE,
+)
 from src.database.repo.requests import RequestsRepo
+from src.database.writer import WriteQueue, set_writer
+
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT * 1000}",
+    f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KIB}",
+    f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}",
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+def is_sqlite(url: str) -> bool:
+    """Проверяет, что URI указывает на базу SQLite."""
+    return make_url(url).get_backend_name() == "sqlite"
+
+
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """Настройка каждого нового соединения SQLite."""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
+def create_sqlite_engine(
+    url: str, echo: bool = False, pool_size: int = SQLITE_READ_POOL_SIZE
+) -> AsyncEngine:
+    """
+    Создает асинхронный движок SQLite с рабочим профилем.
+
+    WAL позволяет читать параллельно с записью, synchronous=NORMAL
+    в режиме WAL не делает fsync на каждую транзакцию, busy_timeout
+    заменяет ошибку "database is locked" ожиданием блокировки.
+    Пул ограничен `pool_size` без переполнения, поэтому сессии не держат
+    соединение на время загрузок и отправок в Telegram.
+
+    :param url: URI для подключения к базе данных
+    :param echo: Логирование запросов SQL
+    :param pool_size: Число соединений в пуле
+    :return: Асинхронный движок SQLAlchemy
+    """
+    engine = create_async_engine(
+        url=url,
+        echo=echo,
+        pool_size=pool_size,
+        max_overflow=0,
+        connect_args={"timeout": SQLITE_BUSY_TIMEOUT},
+    )
+    event.listen(engine.sync_engine, "connect", _set_sqlite_pragmas)
+    return engine
 
 
 def create_engine(
@@ -9,6 +67,7 @@ def create_engine(
 ) -> AsyncEngine:
     """
     Создает и возвращает асинхронный движок SQLAlchemy.
+    Для SQLite используется профиль `create_sqlite_engine` с пулом соединений для чтения.
 
     :param url: URI для подключения к базе данных
     :param echo: Логирование запросов SQL
@@ -16,13 +75,14 @@ def create_engine(
     :param pool_size: Размер пула подключений
     :return: Асинхронный движок SQLAlchemy
     """
+    if is_sqlite(url):
+        return create_sqlite_engine(url, echo=echo)
     return create_async_engine(
         url=url,
         echo=echo,
-        # future=True,
-        # pool_pre_ping=True,
-        # pool_timeout=pool_timeout,
-        # pool_size=pool_size,
+        pool_pre_ping=True,
+        pool_timeout=pool_timeout,
+        pool_size=pool_size,
     )
 
 
@@ -44,6 +104,14 @@ engine: AsyncEngine = create_engine(url=settings.DB_URI)
 
 async_session_pool = get_async_session_maker(engine)
 
+# SQLite допускает одного писателя: запись идет через очередь с отдельным соединением,
+# у Postgres запись идет через общий пул
+if is_sqlite(settings.DB_URI):
+    write_engine: AsyncEngine = create_sqlite_engine(settings.DB_URI, pool_size=1)
+    set_writer(WriteQueue(get_async_session_maker(write_engine)))
+else:
+    write_engine = engine
+
 
 async def get_repo():
     async with async_session_pool() as session:
@@ -4,3 +4,4 @@ from src.database.models.base import Base  # noqa
 from src.database.models.user import User  # noqa
 from src.database.models.broadcast import Broadcast  # noqa
 from src.database.models.favourite import Favourite  # noqa
+from src.database.models.mailing import Mailing  # noqa
@@ -1,6 +1,6 @@
 from datetime import date
 
-from sqlalchemy import String, Date, Enum
+from sqlalchemy import BigInteger, Boolean, Integer, String, Date, Enum, false
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.database.models.base import Base
@@ -13,6 +13,17 @@ class Broadcast(Base):
     release_type: Mapped[str] = mapped_column(Enum(ReleaseType), nullable=True)
     comment: Mapped[str] = mapped_column(String(128), nullable=True)
     filename: Mapped[str] = mapped_column(String(128), nullable=True)
+    # перекодированная копия файла, путь относительно каталога выпусков
+    compact_filename: Mapped[str] = mapped_column(String(160), nullable=True)
+    # SHA-256 содержимого файла и признак поврежденного файла
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=True, index=True)
+    file_corrupt: Mapped[bool] = mapped_column(
+        Boolean, default=False, server_default=false()
+    )
+    # метаданные файла: размер в байтах, длительность в секундах, битрейт в бит/с
+    file_size: Mapped[int] = mapped_column(BigInteger, nullable=True)
+    duration: Mapped[int] = mapped_column(Integer, nullable=True)
+    bitrate: Mapped[int] = mapped_column(Integer, nullable=True)
     telegram_file_id: Mapped[str] = mapped_column(
         String(128), nullable=True
     )
@@ -0,0 +1,21 @@
+from datetime import datetime
+
+from sqlalchemy import ForeignKey, Integer, func
+from sqlalchemy.dialects.postgresql import TIMESTAMP
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database.models.base import Base
+
+
+class Mailing(Base):
+    """Модель рассылки нового выпуска всем пользователям."""
+
+    broadcast_id: Mapped[int] = mapped_column(ForeignKey("broadcasts.id"), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(TIMESTAMP, server_default=func.now())
+    finished_at: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=True)
+
+    # id последнего пользователя, до которого дошла рассылка
+    last_user_id: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    sent: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    blocked: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    failed: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import BIGINT, String, func, Boolean
+from sqlalchemy import BIGINT, String, func, Boolean, Integer
 from sqlalchemy.dialects.postgresql import TIMESTAMP
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -19,6 +19,12 @@ class User(Base):
     created_at: Mapped[datetime] = mapped_column(TIMESTAMP, server_default=func.now())
     show_role_name: Mapped[bool] = mapped_column(Boolean, default=False)
 
+    # очередь /show без повторов: ключ перестановки каталога,
+    # позиция в ней и размер каталога на момент начала прохода
+    shuffle_seed: Mapped[int] = mapped_column(BIGINT, default=0, server_default="0")
+    shuffle_cursor: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+    shuffle_size: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
+
     # список объектов Favourite
     favourites: Mapped[list["Favourite"]] = relationship(
         back_populates="user", cascade="all, delete-orphan"
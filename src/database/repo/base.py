@@ -1,19 +1,56 @@
-from typing import Optional
+from typing import Any, Optional
 
-from sqlalchemy import select
+from sqlalchemy import Executable, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
 from src.database.models.user import User
+from src.database.writer import WriteJob, WriteQueue, run_write
 
 
 class BaseRepo:
     """
     Класс, реализующий функциональность репозитория для выполнения операций с базой данных.
+
+    Запись выполняется заданиями (`WriteJob`): через очередь записи `writer`,
+    если она подключена, иначе в сессии с фиксацией после каждого вызова.
+
+    При `autocommit=False` (режим единицы работы) задания записи откладываются
+    в `staged` и выполняются одной транзакцией в `RequestsRepo.commit()`:
+    транзакция записи не остается открытой, пока хендлер ждет сеть.
+    До фиксации изменения в БД не видны, а методы записи возвращают None
+    (кроме `create` и `update`, возвращающих переданный объект).
     """
 
-    def __init__(self, model, session):
+    def __init__(
+        self,
+        model,
+        session,
+        autocommit: bool = True,
+        writer: Optional[WriteQueue] = None,
+        staged: Optional[list[WriteJob]] = None,
+    ):
         self.model = model
         self.session: AsyncSession = session
+        self.autocommit = autocommit
+        self.writer = writer
+        self.staged = staged if staged is not None else []
+
+    async def _write(self, job: WriteJob) -> Any:
+        """Задание записи: сразу или, в режиме единицы работы, при фиксации"""
+        if not self.autocommit:
+            self.staged.append(job)
+            return None
+        return await run_write(self.session, self.writer, job)
+
+    @staticmethod
+    def _statement(statement: Executable, params: Optional[Any] = None) -> WriteJob:
+        """Задание из одного запроса (для executemany params - список строк)"""
+
+        async def job(session: AsyncSession) -> None:
+            await session.execute(statement, params)
+
+        return job
 
     async def get(self, obj_id: int):
         db_obj = await self.session.execute(
@@ -29,26 +66,71 @@ class BaseRepo:
         db_objs = await self.session.execute(select(self.model).order_by(self.model.id))
         return db_objs.scalars().all()
 
-    async def create(self, data: dict, user: Optional[User] = None):
+    async def create(
+        self, data: dict, user: Optional[User] = None, refresh: bool = True
+    ):
+        """
+        Создание записи; без `refresh` значения по умолчанию на стороне сервера
+        не перечитываются из БД. В режиме единицы работы id записи
+        появляется у объекта после фиксации
+        """
         if user is not None:
             data["user_id"] = user.id
         db_obj = self.model(**data)
-        self.session.add(db_obj)
-        await self.session.commit()
-        await self.session.refresh(db_obj)
+
+        async def job(session: AsyncSession) -> None:
+            session.add(db_obj)
+            await session.flush()
+            if refresh:
+                await session.refresh(db_obj)
+
+        await self._write(job)
         return db_obj
 
-    async def update(self, obj, update_data: dict):
-        obj_data = {c.name: getattr(obj, c.name) for c in obj.__table__.columns}
-        for field in obj_data:
-            if field in update_data:
-                setattr(obj, field, update_data[field])
-        self.session.add(obj)
-        await self.session.commit()
-        await self.session.refresh(obj)
+    async def bulk_create(self, rows: list[dict]) -> None:
+        """Вставка списка записей одним запросом в одной транзакции"""
+        await self._write(self._statement(insert(self.model), rows))
+
+    async def update(self, obj, update_data: dict, refresh: bool = True):
+        """
+        Обновление полей записи запросом UPDATE; значения сразу переносятся
+        в объект, не привязывая его к сессии. С `refresh` остальные поля
+        перечитываются из БД при записи
+        """
+        columns = self.model.__table__.columns
+        values = {field: value for field, value in update_data.items() if field in columns}
+        for field, value in values.items():
+            set_committed_value(obj, field, value)
+        statement = update(self.model).where(self.model.id == obj.id).values(**values)
+
+        async def job(session: AsyncSession) -> None:
+            if not refresh:
+                await session.execute(statement)
+                return
+            row = await session.execute(statement.returning(*columns))
+            for field, value in row.one()._mapping.items():
+                set_committed_value(obj, field, value)
+
+        await self._write(job)
         return obj
 
+    async def bulk_update(self, rows: list[dict]) -> None:
+        """Обновление списка записей по id одним запросом в одной транзакции"""
+        await self._write(self._statement(update(self.model), rows))
+
+    async def update_by_id(self, obj_id: int, update_data: dict) -> None:
+        """Обновление полей записи одним запросом, без загрузки объекта"""
+        await self._write(
+            self._statement(
+                update(self.model).where(self.model.id == obj_id).values(**update_data)
+            )
+        )
+
     async def remove(self, obj):
-        await self.session.delete(obj)
-        await self.session.commit()
+        """Удаление записи вместе с каскадными связями"""
+
+        async def job(session: AsyncSession) -> None:
+            await session.delete(await session.merge(obj))
+
+        await self._write(job)
         return obj
@@ -1,27 +1,232 @@
+from datetime import date
 from typing import Optional
 
-from sqlalchemy import select, func, or_
+from sqlalchemy import Row, case, select, func, or_, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models.broadcast import Broadcast
 from src.database.repo.base import BaseRepo
+from src.utils.enums import ReleaseType
 
+# ключ выпуска в каталоге: (дата или комментарий, тип выпуска, роль)
+CatalogKey = tuple[date | str | None, ReleaseType, str]
 
-class BroadcastRepo(BaseRepo):
-    async def get_random_broadcast(self) -> Optional[Broadcast]:
-        """Возвращает случайный выпуск"""
-        db_obj = await self.session.execute(
-            select(self.model).order_by(func.random()).limit(1)
-        )
-        return db_obj.scalars().one_or_none()
 
+class BroadcastRepo(BaseRepo):
     async def get_broadcast_by_file_id(self, file_id: str) -> Optional[Broadcast]:
-        """Ищет выпуск по file_id"""
+        """
+        Ищет выпуск по file_id. После схлопывания дубликатов file_id общий
+        у нескольких выпусков - возвращается первый из них
+        """
         db_obj = await self.session.execute(
-            select(self.model).where(
+            select(self.model)
+            .where(
                 or_(
                     self.model.telegram_file_id == file_id,
                     self.model.telegram_file_id_alt == file_id,
                 )
             )
+            .order_by(self.model.id)
         )
+        return db_obj.scalars().first()
+
+    async def get_last_id(self) -> Optional[int]:
+        """Возвращает id последнего добавленного выпуска"""
+        db_obj = await self.session.execute(select(func.max(self.model.id)))
         return db_obj.scalar_one_or_none()
+
+    async def get_missing_file_ids(self) -> list[Broadcast]:
+        """Возвращает выпуски с файлом, у которых не сохранен хотя бы один file_id"""
+        db_objs = await self.session.execute(
+            select(self.model)
+            .where(
+                self.model.filename.is_not(None),
+                self.model.file_corrupt.is_(False),
+                or_(
+                    self.model.telegram_file_id.is_(None),
+                    self.model.telegram_file_id_alt.is_(None),
+                ),
+            )
+            .order_by(self.model.id)
+        )
+        return list(db_objs.scalars().all())
+
+    async def get_catalog_entries(self) -> list[Row]:
+        """Возвращает поля всех выпусков, нужные для отправки аудио"""
+        db_objs = await self.session.execute(
+            select(
+                self.model.id,
+                self.model.role_name,
+                self.model.filename,
+                self.model.compact_filename,
+                self.model.telegram_file_id,
+                self.model.telegram_file_id_alt,
+                self.model.duration,
+            )
+            .where(self.model.file_corrupt.is_(False))
+            .order_by(self.model.id)
+        )
+        return list(db_objs.all())
+
+    async def get_untranscoded(self) -> list[str]:
+        """
+        Возвращает имена файлов без перекодированной копии, каждое один раз
+        (после схлопывания дубликатов файл может принадлежать нескольким выпускам)
+        """
+        db_objs = await self.session.execute(
+            select(self.model.filename)
+            .where(
+                self.model.filename.is_not(None),
+                self.model.compact_filename.is_(None),
+                self.model.file_corrupt.is_(False),
+            )
+            .group_by(self.model.filename)
+            .order_by(func.min(self.model.id))
+        )
+        return list(db_objs.scalars().all())
+
+    async def update_compact_filename(
+        self, filename: str, compact_filename: str
+    ) -> Optional[list[int]]:
+        """
+        Сохраняет перекодированную копию для всех выпусков с этим файлом.
+        Возвращает id обновленных выпусков (в режиме единицы работы - None)
+        """
+        statement = (
+            update(self.model)
+            .where(self.model.filename == filename)
+            .values(compact_filename=compact_filename)
+            .returning(self.model.id)
+        )
+
+        async def job(session: AsyncSession) -> list[int]:
+            db_objs = await session.execute(statement)
+            return list(db_objs.scalars().all())
+
+        return await self._write(job)
+
+    async def get_uninspected(self) -> list[Row]:
+        """
+        Возвращает id и имена файлов выпусков, еще не попавших в индекс
+        содержимого или без сохраненных метаданных файла
+        """
+        db_objs = await self.session.execute(
+            select(self.model.id, self.model.filename)
+            .where(
+                self.model.filename.is_not(None),
+                or_(
+                    self.model.content_hash.is_(None),
+                    self.model.file_size.is_(None),
+                ),
+            )
+            .order_by(self.model.id)
+        )
+        return list(db_objs.all())
+
+    async def get_duplicates(self) -> list[Row]:
+        """Возвращает выпуски, содержимое файлов которых совпадает, по группам"""
+        duplicate_hashes = (
+            select(self.model.content_hash)
+            .where(self.model.content_hash.is_not(None))
+            .group_by(self.model.content_hash)
+            .having(func.count() > 1)
+        )
+        db_objs = await self.session.execute(
+            select(
+                self.model.id,
+                self.model.content_hash,
+                self.model.filename,
+                self.model.compact_filename,
+                self.model.telegram_file_id,
+            )
+            .where(self.model.content_hash.in_(duplicate_hashes))
+            .order_by(self.model.content_hash, self.model.id)
+        )
+        return list(db_objs.all())
+
+    async def update_file_id(
+        self,
+        broadcast_id: int,
+        field: str,
+        file_id: str,
+        filename: Optional[str] = None,
+        role_name: Optional[str] = None,
+    ) -> None:
+        """
+        Сохраняет file_id выпуска и выпусков с тем же файлом
+        (и той же ролью, если она передана)
+        """
+        condition = (
+            self.model.id == broadcast_id
+            if filename is None
+            else self.model.filename == filename
+        )
+        if role_name is not None:
+            condition &= self.model.role_name == role_name
+        await self._write(
+            self._statement(update(self.model).where(condition).values({field: file_id}))
+        )
+
+    async def get_storage_stats(self) -> Row:
+        """
+        Возвращает сводку по файлам каталога из сохраненных метаданных:
+        число файлов, общий размер и длительность, а также объем загрузок
+        для вариантов выпусков без file_id
+        """
+        # после схлопывания дубликатов один файл может принадлежать нескольким выпускам
+        files = (
+            select(
+                self.model.filename,
+                func.max(self.model.file_size).label("file_size"),
+                func.max(self.model.duration).label("duration"),
+            )
+            .where(
+                self.model.filename.is_not(None),
+                self.model.file_size.is_not(None),
+                self.model.file_corrupt.is_(False),
+            )
+            .group_by(self.model.filename)
+            .subquery()
+        )
+        pending_uploads = select(
+            func.coalesce(
+                func.sum(
+                    case(
+                        (self.model.telegram_file_id.is_(None), self.model.file_size),
+                        else_=0,
+                    )
+                    + case(
+                        (self.model.telegram_file_id_alt.is_(None), self.model.file_size),
+                        else_=0,
+                    )
+                ),
+                0,
+            )
+        ).where(
+            self.model.file_size.is_not(None),
+            self.model.file_corrupt.is_(False),
+        )
+        db_obj = await self.session.execute(
+            select(
+                func.count(files.c.filename).label("files"),
+                func.coalesce(func.sum(files.c.file_size), 0).label("total_size"),
+                func.coalesce(func.sum(files.c.duration), 0).label("total_duration"),
+                pending_uploads.scalar_subquery().label("pending_upload_size"),
+            )
+        )
+        return db_obj.one()
+
+    async def get_catalog_keys(self) -> set[CatalogKey]:
+        """Возвращает ключи всех выпусков каталога"""
+        db_objs = await self.session.execute(
+            select(
+                self.model.release_date,
+                self.model.comment,
+                self.model.release_type,
+                self.model.role_name,
+            )
+        )
+        return {
+            (release_date or comment, release_type, role_name)
+            for release_date, comment, release_type, role_name in db_objs
+        }
@@ -2,6 +2,7 @@ from typing import Optional
 
 from sqlalchemy import delete
 from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models.favourite import Favourite
 from src.database.repo.base import BaseRepo
@@ -16,6 +17,7 @@ class FavouriteRepo(BaseRepo):
         Добавляет запись «избранное».
         Благодаря composite-PK + UniqueConstraint возможен upsert-вариант
         через `ON CONFLICT DO NOTHING`, чтобы тихо игнорировать дубликаты.
+        В режиме единицы работы возвращает None.
         """
         stmt = (
             insert(Favourite)
@@ -23,16 +25,20 @@ class FavouriteRepo(BaseRepo):
             .on_conflict_do_nothing()
             .returning(Favourite)
         )
-        res = await self.session.execute(stmt)
-        await self.session.commit()
-        return res.scalar_one_or_none()  # None, если запись уже существовала
+
+        async def job(session: AsyncSession) -> Optional[Favourite]:
+            res = await session.execute(stmt)
+            return res.scalar_one_or_none()  # None, если запись уже существовала
+
+        return await self._write(job)
 
     async def remove_favourite(
         self, *, user_id: int, broadcast_id: int
-    ) -> bool:
+    ) -> Optional[bool]:
         """
         Удаляет запись «избранное».
-        Возвращает True, если что-то действительно удалилось.
+        Возвращает True, если что-то действительно удалилось
+        (в режиме единицы работы - None).
         """
         stmt = (
             delete(Favourite)
@@ -42,6 +48,9 @@ class FavouriteRepo(BaseRepo):
             )
             .returning(Favourite.user_id)
         )
-        res = await self.session.execute(stmt)
-        await self.session.commit()
-        return res.scalar_one_or_none() is not None
\ No newline at end of file
+
+        async def job(session: AsyncSession) -> bool:
+            res = await session.execute(stmt)
+            return res.scalar_one_or_none() is not None
+
+        return await self._write(job)
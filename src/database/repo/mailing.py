@@ -0,0 +1,47 @@
+from sqlalchemy import func, select
+
+from src.database.models.broadcast import Broadcast
+from src.database.models.mailing import Mailing
+from src.database.repo.base import BaseRepo
+
+
+class MailingRepo(BaseRepo):
+    async def create_for_new_broadcasts(self, after_id: int, limit: int) -> int:
+        """
+        Создает рассылки последних выпусков с id больше after_id
+        и возвращает их число
+        """
+        db_objs = await self.session.execute(
+            select(Broadcast.id)
+            .where(Broadcast.id > after_id)
+            .order_by(Broadcast.id.desc())
+            .limit(limit)
+        )
+        broadcast_ids = sorted(db_objs.scalars().all())
+        if broadcast_ids:
+            await self.bulk_create(
+                [{"broadcast_id": broadcast_id} for broadcast_id in broadcast_ids]
+            )
+        return len(broadcast_ids)
+
+    async def get_unfinished(self) -> list[Mailing]:
+        """Возвращает незавершенные рассылки"""
+        db_objs = await self.session.execute(
+            select(self.model)
+            .where(self.model.finished_at.is_(None))
+            .order_by(self.model.id)
+        )
+        return list(db_objs.scalars().all())
+
+    async def finish(self, mailing: Mailing) -> None:
+        """Отмечает рассылку завершенной и сохраняет ее итоги"""
+        await self.update_by_id(
+            mailing.id,
+            {
+                "finished_at": func.now(),
+                "last_user_id": mailing.last_user_id,
+                "sent": mailing.sent,
+                "blocked": mailing.blocked,
+                "failed": mailing.failed,
+            },
+        )
@@ -1,13 +1,17 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models.favourite import Favourite
+from src.database.models.mailing import Mailing
 from src.database.models.broadcast import Broadcast
 from src.database.models.user import User
 from src.database.repo.broadcast import BroadcastRepo
 from src.database.repo.favourite import FavouriteRepo
+from src.database.repo.mailing import MailingRepo
 from src.database.repo.user import UserRepo
+from src.database.writer import WriteJob, WriteQueue, get_writer, run_write
 
 
 @dataclass
@@ -17,18 +21,53 @@ class RequestsRepo:
     Этот класс содержит все хранилища для моделей баз данных.
     Вы можете добавить дополнительные хранилища в качестве свойств к этому классу,
     чтобы они были легко доступны.
+
+    При `autocommit=False` хранилища работают в режиме единицы работы:
+    запись откладывается и выполняется одной транзакцией в `commit`.
+    Запись через очередь `writer` (профиль SQLite) подключается автоматически.
     """
 
     session: AsyncSession
+    autocommit: bool = True
+    writer: Optional[WriteQueue] = field(default_factory=get_writer)
+    staged: list[WriteJob] = field(default_factory=list)
+
+    def _repo_options(self) -> dict:
+        return {
+            "session": self.session,
+            "autocommit": self.autocommit,
+            "writer": self.writer,
+            "staged": self.staged,
+        }
 
     @property
     def broadcasts(self) -> BroadcastRepo:
-        return BroadcastRepo(model=Broadcast, session=self.session)
+        return BroadcastRepo(model=Broadcast, **self._repo_options())
 
     @property
     def users(self) -> UserRepo:
-        return UserRepo(model=User, session=self.session)
+        return UserRepo(model=User, **self._repo_options())
 
     @property
     def favourites(self) -> FavouriteRepo:
-        return FavouriteRepo(model=Favourite, session=self.session)
\ No newline at end of file
+        return FavouriteRepo(model=Favourite, **self._repo_options())
+
+    @property
+    def mailings(self) -> MailingRepo:
+        return MailingRepo(model=Mailing, **self._repo_options())
+
+    async def commit(self) -> None:
+        """Фиксация изменений, накопленных в режиме единицы работы"""
+        # сессия хендлера только читает: завершение транзакции возвращает соединение
+        if self.session.in_transaction():
+            await self.session.commit()
+        if not self.staged:
+            return
+        staged = list(self.staged)
+        self.staged.clear()
+
+        async def job(session: AsyncSession) -> None:
+            for staged_job in staged:
+                await staged_job(session)
+
+        await run_write(self.session, self.writer, job)
@@ -1,6 +1,8 @@
 from typing import Optional
 
+from sqlalchemy import Row, select
 from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models.user import User
 from src.database.repo.base import BaseRepo
@@ -11,7 +13,9 @@ class UserRepo(BaseRepo):
     async def get_or_create_user(self, **kwargs) -> Optional[User]:
         """
         Создает или обновляет нового пользователя в базе данных
-        и возвращает объект User.
+        и возвращает объект User, не привязанный к сессии
+        (объект может храниться в кэше пользователей).
+        В режиме единицы работы возвращает None.
         """
         insert_stmt = (
             insert(User)
@@ -22,7 +26,32 @@ class UserRepo(BaseRepo):
             )
             .returning(User)
         )
-        result = await self.session.execute(insert_stmt)
 
-        await self.session.commit()
-        return result.scalar_one_or_none()
+        async def job(session: AsyncSession) -> User:
+            result = await session.execute(insert_stmt)
+            user = result.scalar_one()
+            session.expunge(user)
+            return user
+
+        return await self._write(job)
+
+    async def update_user(self, user: User, update_data: dict) -> User:
+        """
+        Обновляет поля пользователя запросом UPDATE и переносит их
+        в переданный объект, не привязывая его к сессии
+        (объект может храниться в кэше пользователей).
+        """
+        return await self.update(user, update_data, refresh=False)
+
+    async def get_recipients(self, after_id: int, limit: int) -> list[Row]:
+        """
+        Возвращает страницу получателей рассылки с id больше after_id:
+        (id, telegram_id, show_role_name)
+        """
+        db_objs = await self.session.execute(
+            select(User.id, User.telegram_id, User.show_role_name)
+            .where(User.id > after_id)
+            .order_by(User.id)
+            .limit(limit)
+        )
+        return list(db_objs.all())
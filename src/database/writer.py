@@ -0,0 +1,109 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from src.core.constants import WRITE_BATCH_SIZE
+from src.core.logger import logger
+
+# задание записи: запросы в переданной сессии, результат (строки RETURNING,
+# объекты) должен быть получен внутри задания, до фиксации транзакции
+WriteJob = Callable[[AsyncSession], Awaitable[Any]]
+
+
+class WriteQueue:
+    """
+    Очередь записи в БД с единственным писателем.
+
+    Все запросы на запись выполняются одной задачей через отдельное соединение,
+    поэтому записи SQLite не конкурируют за блокировку базы. Задания,
+    накопившиеся за время предыдущей транзакции, выполняются одной
+    транзакцией (до `batch_size`), что экономит fsync на каждой мелкой записи.
+    Вызов `run` завершается после фиксации транзакции и возвращает
+    результат задания; если общая
+    транзакция не удалась, задания пачки повторяются по одному,
+    чтобы ошибка одного не отменяла остальные.
+    """
+
+    def __init__(
+        self, session_pool: async_sessionmaker, batch_size: int = WRITE_BATCH_SIZE
+    ):
+        self._session_pool = session_pool
+        self.batch_size = batch_size
+        self._queue: asyncio.Queue[tuple[WriteJob, asyncio.Future]] = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    async def run(self, job: WriteJob) -> Any:
+        """Выполнение задания в очереди писателя, результат - после фиксации."""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((job, future))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return await future
+
+    async def _run(self) -> None:
+        """Выполнение заданий очереди пачками, пока она не опустеет."""
+        while not self._queue.empty():
+            batch = []
+            while not self._queue.empty() and len(batch) < self.batch_size:
+                batch.append(self._queue.get_nowait())
+            try:
+                try:
+                    await self._write(batch)
+                except Exception as e:
+                    logger.warning(f"Пачка записи ({len(batch)}) не удалась: {e}")
+                    for job in batch:
+                        await self._write([job])
+            except BaseException as e:
+                # писатель остановлен (отмена при завершении): задания уже сняты
+                # с очереди или остаются в ней без писателя - вызвавшие не ждут вечно
+                while not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                raise
+
+    async def _write(self, batch: list[tuple[WriteJob, asyncio.Future]]) -> None:
+        """Одна транзакция на всю пачку заданий."""
+        try:
+            async with self._session_pool() as session:
+                results = [await job(session) for job, _ in batch]
+                await session.commit()
+        except Exception as e:
+            if len(batch) > 1:
+                raise
+            # ошибка одиночного задания передается вызвавшему его
+            _, future = batch[0]
+            if not future.done():
+                future.set_exception(e)
+            return
+        # отмененный вызов результата не ждет, но запись уже выполнена
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+_writer: Optional[WriteQueue] = None
+
+
+def set_writer(writer: Optional[WriteQueue]) -> None:
+    """Подключение очереди записи, через которую пишут хранилища."""
+    global _writer
+    _writer = writer
+
+
+def get_writer() -> Optional[WriteQueue]:
+    """Очередь записи или None, если хранилища пишут напрямую через сессию."""
+    return _writer
+
+
+async def run_write(
+    session: AsyncSession, writer: Optional[WriteQueue], job: WriteJob
+) -> Any:
+    """Выполнение задания записи: через очередь записи или в сессии с фиксацией."""
+    if writer is not None:
+        return await writer.run(job)
+    result = await job(session)
+    await session.commit()
+    return result
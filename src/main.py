@@ -1,22 +1,57 @@
 import argparse
 import asyncio
+from pathlib import Path
 
 from src.bot.setup import setup_bot, setup_dispatcher
 from src.core.logger import logger
-from src.utils.parser import run_parser
+from src.database.connect import async_session_pool
+from src.services.storage_report import get_storage_report
+from src.utils.enums import ParserMode
+from src.utils.parser import run_parser, parse_snapshot
 
 
 def parse_args() -> argparse.Namespace:
     """Обработка аргументов командной строки."""
     parser = argparse.ArgumentParser(description="Френки-шоу бот")
     parser.add_argument("-p", "--parse", action="store_true", help="Запустить парсер")
+    parser.add_argument(
+        "-m",
+        "--mode",
+        type=ParserMode,
+        choices=[mode.value for mode in ParserMode],
+        help="Режим загрузки выпусков: http (по умолчанию) или selenium",
+    )
+    parser.add_argument(
+        "-f",
+        "--full",
+        action="store_true",
+        help="Полный обход архива без пропуска уже сохраненных выпусков",
+    )
+    parser.add_argument(
+        "-s",
+        "--snapshot",
+        type=Path,
+        help="Разобрать сохраненную HTML-страницу архива без браузера и сети",
+    )
+    parser.add_argument(
+        "-r",
+        "--report",
+        action="store_true",
+        help="Вывести сводку по хранилищу выпусков и трафику",
+    )
     return parser.parse_args()
 
 
 async def main(args: argparse.Namespace) -> None:
     """Основная точка входа в приложение."""
+    if args.snapshot:
+        parse_snapshot(args.snapshot)
+        return
+    if args.report:
+        logger.info(f"Хранилище выпусков: {await get_storage_report(async_session_pool)}")
+        return
     if args.parse:
-        await run_parser()
+        await run_parser(args.mode, incremental=False if args.full else None)
     bot = setup_bot()
     dp = setup_dispatcher()
 
@@ -10,17 +10,29 @@ from src.bot.utils.send_message import notify_admin
 from src.core.constants import DEFAULT_AUDIO_TITLE, DEFAULT_AUDIO_PERFORMER
 from src.core.exceptions import AudioFileNotFound, DatabaseError
 from src.core.logger import logger
-from src.core.paths import BROADCASTS_DIR
 from src.database.models.broadcast import Broadcast
 from src.database.models.user import User
 from src.database.repo.requests import RequestsRepo
-from src.services.filemanager import FileManager
+from src.services.catalog import CatalogEntry, catalog
+from src.services.filemanager import FileManager, file_manager
+from src.utils.singleflight import SingleFlight
+
+
+FILE_ID_FIELDS = {False: "telegram_file_id", True: "telegram_file_id_alt"}
+
+# загрузки выпусков в процессе, по ключу (id выпуска, вариант)
+_uploads = SingleFlight()
+
+
+def get_audio_title(broadcast: Broadcast | CatalogEntry, use_alt: bool) -> str:
+    """Заголовок аудио: имя роли или заглушка, скрывающая роль"""
+    return broadcast.role_name if use_alt else DEFAULT_AUDIO_TITLE
 
 
 class FileIDManager:
     """Управление Telegram file_id и их хранением в БД"""
 
-    def __init__(self, repo: RequestsRepo, broadcast: Broadcast):
+    def __init__(self, repo: RequestsRepo, broadcast: Broadcast | CatalogEntry):
         self.broadcast = broadcast
         self._repo = repo
 
@@ -34,13 +46,30 @@ class FileIDManager:
 
     async def update_file_id(self, field: str, new_file_id: str) -> None:
         """Обновить file_id в базе данных"""
+        broadcast = self.broadcast
+        # вариант с именем роли делят только выпуски той же роли
+        role_name = broadcast.role_name if field == FILE_ID_FIELDS[True] else None
         try:
-            await self._repo.broadcasts.update(self.broadcast, {field: new_file_id})
-            logger.info(f"Обновлен {field} для Broadcast {self.broadcast.id}")
+            # дубликаты с тем же файлом получают тот же file_id
+            await self._repo.broadcasts.update_file_id(
+                broadcast.id,
+                field,
+                new_file_id,
+                filename=broadcast.filename,
+                role_name=role_name,
+            )
         except Exception as e:
             logger.error(f"Ошибка обновления {field}: {str(e)}")
             raise DatabaseError("Не удалось обновить file_id") from e
 
+        # file_id действителен в Telegram, даже если запись хендлера откатится
+        if broadcast.filename is None:
+            catalog.update(broadcast.id, **{field: new_file_id})
+        else:
+            catalog.update_file(broadcast.filename, role_name, **{field: new_file_id})
+        setattr(broadcast, field, new_file_id)
+        logger.info(f"Обновлен {field} для Broadcast {broadcast.id}")
+
 
 class AudioSender:
     """Отправка аудио с обработкой ошибок и повторами"""
@@ -65,9 +94,9 @@ class AudioSender:
             if file_id:
                 return await self._send_audio(chat_id, file_id, title)
 
-            file_path = self._file_manager.get_file(filename)
+            file_path = self._get_audio_source(filename)
             if file_path:
-                return await self._send_local_file(chat_id, filename, use_alt, title)
+                return await self._send_uploaded(chat_id, filename, use_alt, title)
 
             return None
 
@@ -76,7 +105,7 @@ class AudioSender:
                 logger.warning(
                     f"Обнаружен невалидный file_id (ID {self._file_id_manager.broadcast.id}), отправляем локальный файл"
                 )
-                return await self._send_local_file(chat_id, filename, use_alt, title)
+                return await self._send_uploaded(chat_id, filename, use_alt, title)
 
         except FileNotFoundError:
             error_message = f"Файл {filename} (ID) отсутствует на сервере"
@@ -87,6 +116,12 @@ class AudioSender:
         except Exception as e:
             logger.error(e)
 
+    def _get_audio_source(self, filename: str) -> Path:
+        """Путь к файлу выпуска: перекодированная копия, если она есть"""
+        return self._file_manager.get_file(
+            filename, self._file_id_manager.broadcast.compact_filename
+        )
+
     async def _send_audio(self, chat_id: int, file_id: str, title: str) -> Message:
         """Отправка аудио через Telegram API"""
 
@@ -95,9 +130,39 @@ class AudioSender:
             audio=file_id,
             title=title,
             performer=DEFAULT_AUDIO_PERFORMER,
+            duration=self._file_id_manager.broadcast.duration,
         )
 
-    async def _send_local_file(
+    async def _send_uploaded(
+        self,
+        chat_id: int,
+        filename: str,
+        use_alt: bool,
+        title: str,
+    ) -> Message:
+        """Отправка локального файла или, если его уже загружают, отправка по file_id"""
+        message, shared = await self.upload_once(chat_id, filename, use_alt, title)
+        if shared:
+            return await self._send_audio(chat_id, message.audio.file_id, title)
+        return message
+
+    async def upload_once(
+        self,
+        chat_id: int,
+        filename: str,
+        use_alt: bool,
+        title: str,
+    ) -> tuple[Message, bool]:
+        """
+        Загрузка варианта выпуска, общая для одновременных запросов.
+        Возвращает сообщение с загрузкой и признак того, что его отправил другой запрос.
+        """
+        key = (self._file_id_manager.broadcast.id, use_alt)
+        return await _uploads.do(
+            key, lambda: self.upload_local_file(chat_id, filename, use_alt, title)
+        )
+
+    async def upload_local_file(
         self,
         chat_id: int,
         filename: str,
@@ -105,28 +170,36 @@ class AudioSender:
         title: str,
     ) -> Message:
         """Отправка локального файла с последующим сохранением file_id"""
-        audio_source = self._file_manager.get_file(filename)
+        audio_source = self._get_audio_source(filename)
         message = await self._bot.send_audio(
             chat_id=chat_id,
             audio=FSInputFile(audio_source),
             title=title,
             performer=DEFAULT_AUDIO_PERFORMER,
+            duration=self._file_id_manager.broadcast.duration,
         )
 
-        field = "telegram_file_id_alt" if use_alt else "telegram_file_id"
-        await self._file_id_manager.update_file_id(field, message.audio.file_id)
+        await self._file_id_manager.update_file_id(
+            FILE_ID_FIELDS[use_alt], message.audio.file_id
+        )
         return message
 
 
 class AudioService:
     """Фасад для работы с аудио сервисом"""
 
-    def __init__(self, user: User, broadcast: Broadcast, repo: RequestsRepo, bot: Bot):
+    def __init__(
+        self,
+        user: User,
+        broadcast: Broadcast | CatalogEntry,
+        repo: RequestsRepo,
+        bot: Bot,
+    ):
         self._user = user
         self._bot = bot
         self._broadcast = broadcast
 
-        self._file_manager = FileManager(files_path=BROADCASTS_DIR)
+        self._file_manager = file_manager
         self._file_id_manager = FileIDManager(repo=repo, broadcast=broadcast)
 
         self._sender = AudioSender(
@@ -137,12 +210,7 @@ class AudioService:
 
     async def send_audio(self) -> Message:
         """Публичный метод для отправки аудио"""
-        sender = AudioSender(
-            bot=self._bot,
-            file_manager=self._file_manager,
-            file_id_manager=self._file_id_manager,
-        )
-        return await sender.send(
+        return await self._sender.send(
             chat_id=self._user.telegram_id,
             filename=self._broadcast.filename,
             use_alt=self._user.show_role_name,
@@ -151,8 +219,4 @@ class AudioService:
 
     def _get_audio_title(self) -> str:
         """Генерация заголовка аудио"""
-        return (
-            self._broadcast.role_name
-            if self._user.show_role_name
-            else DEFAULT_AUDIO_TITLE
-        )
+        return get_audio_title(self._broadcast, self._user.show_role_name)
@@ -0,0 +1,95 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from src.core.logger import logger
+from src.database.repo.requests import RequestsRepo
+
+
+@dataclass(slots=True)
+class CatalogEntry:
+    """Выпуск в кэше каталога: поля, нужные для отправки аудио."""
+
+    id: int
+    role_name: str
+    filename: Optional[str]
+    compact_filename: Optional[str]
+    telegram_file_id: Optional[str]
+    telegram_file_id_alt: Optional[str]
+    duration: Optional[int]
+
+
+class BroadcastCatalog:
+    """
+    Кэш каталога выпусков в памяти процесса.
+
+    Выпуск выбирается по индексу массива (см. `ShuffleBag`) без запроса к БД.
+    Кэш загружается при первом обращении и перезагружается после
+    `invalidate`; изменения file_id вносятся в него через `update`.
+    """
+
+    def __init__(self):
+        self._entries: list[CatalogEntry] = []
+        self._positions: dict[int, int] = {}
+        self._loaded = False
+        self._lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getitem__(self, position: int) -> CatalogEntry:
+        return self._entries[position]
+
+    def __iter__(self) -> Iterator[CatalogEntry]:
+        return iter(self._entries)
+
+    async def load(self, repo: RequestsRepo) -> None:
+        """Загрузка каталога из БД."""
+        entries = [
+            CatalogEntry(*row) for row in await repo.broadcasts.get_catalog_entries()
+        ]
+        self._entries = entries
+        self._positions = {entry.id: position for position, entry in enumerate(entries)}
+        self._loaded = True
+        logger.info(f"Каталог загружен: {len(entries)} выпусков")
+
+    async def ensure_loaded(self, repo: RequestsRepo) -> None:
+        """Загрузка каталога, если он еще не загружен или устарел."""
+        if self._loaded:
+            return
+        async with self._lock:
+            if not self._loaded:
+                await self.load(repo)
+
+    @property
+    def max_id(self) -> int:
+        """Наибольший id выпуска каталога (выпуски упорядочены по id)."""
+        return self._entries[-1].id if self._entries else 0
+
+    def invalidate(self) -> None:
+        """Пометка каталога устаревшим после записи новых выпусков."""
+        self._loaded = False
+
+    def get(self, broadcast_id: int) -> Optional[CatalogEntry]:
+        """Выпуск по id."""
+        if (position := self._positions.get(broadcast_id)) is None:
+            return None
+        return self._entries[position]
+
+    def update(self, broadcast_id: int, **fields) -> None:
+        """Обновление полей выпуска после записи в БД."""
+        if entry := self.get(broadcast_id):
+            for field, value in fields.items():
+                setattr(entry, field, value)
+
+    def update_file(
+        self, filename: str, role_name: Optional[str] = None, **fields
+    ) -> None:
+        """Обновление полей всех выпусков с этим файлом (и этой ролью, если она задана)."""
+        for entry in self._entries:
+            if entry.filename == filename and role_name in (None, entry.role_name):
+                for field, value in fields.items():
+                    setattr(entry, field, value)
+
+
+catalog = BroadcastCatalog()
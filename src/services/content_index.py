@@ -0,0 +1,150 @@
+import asyncio
+import hashlib
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import groupby
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.core.logger import logger
+from src.core.paths import BROADCASTS_DIR
+from src.database.repo.requests import RequestsRepo
+from src.services.catalog import catalog
+from src.utils import mp3
+
+
+def inspect_file(path: str) -> dict:
+    """
+    Хеш содержимого, признак повреждения и метаданные аудио (размер,
+    длительность, битрейт) в виде полей Broadcast.
+    Выполняется в процессе пула; файл читается через mmap без копирования.
+    """
+    with open(path, "rb") as file:
+        size = os.fstat(file.fileno()).st_size
+        if not size:
+            return {
+                "content_hash": hashlib.sha256().hexdigest(),
+                "file_corrupt": True,
+                "file_size": 0,
+                "duration": None,
+                "bitrate": None,
+            }
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            digest = hashlib.sha256(data).hexdigest()
+            stream = mp3.scan(data) if path.lower().endswith(".mp3") else None
+
+    has_audio = stream is not None and stream.frames > 0
+    return {
+        "content_hash": digest,
+        "file_corrupt": stream is not None and not stream.is_valid,
+        "file_size": size,
+        "duration": round(stream.duration) if has_audio else None,
+        "bitrate": stream.bitrate if has_audio else None,
+    }
+
+
+class ContentIndexer:
+    """
+    Индекс содержимого загруженных выпусков.
+
+    Для каждого файла считается SHA-256, проверяется целостность MP3
+    (обрезанные и поврежденные файлы помечаются и не попадают в каталог)
+    и сохраняются размер, длительность и битрейт.
+    Выпуски с одинаковым содержимым сводятся к одному файлу и одному file_id,
+    лишние копии удаляются с диска.
+    """
+
+    def __init__(self, directory: Path = BROADCASTS_DIR, workers: Optional[int] = None):
+        self.directory = Path(directory)
+        self.workers = workers
+
+    async def run(self, session_pool: async_sessionmaker) -> None:
+        """Индексация новых файлов и схлопывание дубликатов."""
+        async with session_pool() as session:
+            repo = RequestsRepo(session)
+            pending = await repo.broadcasts.get_uninspected()
+            if pending:
+                rows = await self._inspect(pending)
+                await repo.broadcasts.bulk_update(rows)
+                corrupt = [row["id"] for row in rows if row["file_corrupt"]]
+                logger.info(f"Проиндексировано файлов: {len(rows)}")
+                if corrupt:
+                    logger.warning(
+                        f"Поврежденные файлы ({len(corrupt)}), выпуски: {corrupt}"
+                    )
+            await self._collapse_duplicates(repo)
+        catalog.invalidate()
+
+    async def _inspect(self, pending: list) -> list[dict]:
+        """Хеширование и проверка файлов в пуле процессов."""
+        loop = asyncio.get_running_loop()
+        jobs = {}
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            for broadcast_id, filename in pending:
+                path = self.directory / filename
+                if not os.path.isfile(path):
+                    logger.error(f"Аудиофайл не найден: {path}")
+                    continue
+                jobs[broadcast_id] = loop.run_in_executor(pool, inspect_file, str(path))
+            results = await asyncio.gather(*jobs.values(), return_exceptions=True)
+
+        rows = []
+        for broadcast_id, result in zip(jobs, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Ошибка индексации выпуска {broadcast_id}: {result}")
+                continue
+            rows.append({"id": broadcast_id, **result})
+        return rows
+
+    async def _collapse_duplicates(self, repo: RequestsRepo) -> None:
+        """
+        Перевод дубликатов на файл первого выпуска с тем же содержимым;
+        file_id и перекодированная копия берутся первые сохраненные в группе.
+        """
+        rows = []
+        redundant: set[str] = set()
+        duplicates = await repo.broadcasts.get_duplicates()
+        for _, group in groupby(duplicates, key=lambda row: row.content_hash):
+            group = list(group)
+            original = group[0]
+            file_id = next(
+                (row.telegram_file_id for row in group if row.telegram_file_id), None
+            )
+            compact_filename = next(
+                (row.compact_filename for row in group if row.compact_filename), None
+            )
+            for row in group:
+                if (row.filename, row.compact_filename, row.telegram_file_id) == (
+                    original.filename,
+                    compact_filename,
+                    file_id,
+                ):
+                    continue
+                rows.append(
+                    {
+                        "id": row.id,
+                        "filename": original.filename,
+                        "compact_filename": compact_filename,
+                        "telegram_file_id": file_id,
+                    }
+                )
+                if row.filename != original.filename:
+                    redundant.add(row.filename)
+                # перекодированная копия удаляемого файла больше не нужна
+                if row.compact_filename not in (None, compact_filename):
+                    redundant.add(row.compact_filename)
+
+        if not rows:
+            return
+        await repo.broadcasts.bulk_update(rows)
+        for filename in redundant:
+            try:
+                os.remove(self.directory / filename)
+            except OSError as e:
+                logger.warning(f"Не удалось удалить дубликат {filename}: {e}")
+        logger.info(
+            f"Дубликаты сведены: выпусков {len(rows)}, удалено файлов {len(redundant)}"
+        )
@@ -0,0 +1,152 @@
+import asyncio
+import os
+from pathlib import Path
+from typing import Optional
+from urllib.parse import unquote, urlsplit
+
+import aiohttp
+
+from src.core.config import settings
+from src.core.constants import DOWNLOAD_CHUNK_SIZE, HTTP_TIMEOUT
+from src.core.exceptions import DownloadError
+from src.core.logger import logger
+from src.core.paths import BROADCASTS_DIR
+from src.services.manifest import DownloadManifest, DownloadRecord
+from src.services.ratelimit import HostLimiter
+from src.utils.html_parser import Form, scan_page, PageScanner
+
+
+class HttpDownloader:
+    """
+    Загрузка выпусков по HTTP без браузера.
+
+    Повторяет действия пользователя на сайте: открывает страницу выпуска,
+    берет код подтверждения, отправляет форму и сохраняет ответ в файл.
+    Число одновременных загрузок ограничено `concurrency`.
+    Недокачанный файл прошлого запуска докачивается запросом с Range.
+    Запросы к сайту проходят через общий `limiter`, который подстраивает
+    их частоту под ответы сервера.
+    """
+
+    def __init__(
+        self,
+        directory: Path = BROADCASTS_DIR,
+        concurrency: int = settings.PARSER.CONCURRENCY,
+        limiter: Optional[HostLimiter] = None,
+    ):
+        self.directory = Path(directory)
+        self.concurrency = concurrency
+        self.limiter = limiter or HostLimiter(settings.PARSER.HOST_CONCURRENCY)
+        self.manifest = DownloadManifest(self.directory)
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "HttpDownloader":
+        os.makedirs(self.directory, exist_ok=True)
+        self._session = aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=None, sock_read=HTTP_TIMEOUT),
+            connector=aiohttp.TCPConnector(limit_per_host=self.concurrency),
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._session:
+            await self._session.close()
+
+    async def fetch_index(self, url: str) -> PageScanner:
+        """Получение главной страницы со списком выпусков (с показом ролей)."""
+        page = await self._get_page(url)
+        if form := page.find_form("show"):
+            async with self.limiter(form.action):
+                async with self._submit(form, clicked="show") as response:
+                    response.raise_for_status()
+                    page = scan_page(await response.text(), str(response.url))
+        return page
+
+    async def download(self, url: str) -> str:
+        """Загрузка выпуска по ссылке. Возвращает имя сохраненного файла."""
+        async with self._semaphore:
+            record = self.manifest.start(url)
+            try:
+                page = await self._get_page(url)
+                if not page.code or not (form := page.find_form("code")):
+                    raise DownloadError(f"На странице {url} не найден код загрузки")
+
+                headers = {}
+                if partial_path := record.partial_path():
+                    headers["Range"] = f"bytes={os.path.getsize(partial_path)}-"
+
+                # частота ограничивает запросы, а не время передачи файла
+                async with self.limiter(form.action):
+                    response = await self._submit(form, headers, code=page.code)
+                    try:
+                        response.raise_for_status()
+                    except aiohttp.ClientResponseError:
+                        response.release()
+                        raise
+                try:
+                    if response.content_type == "text/html":
+                        raise DownloadError(f"Сайт не принял код загрузки для {url}")
+                    return await self._save(record, response)
+                finally:
+                    response.release()
+            except aiohttp.ClientError as e:
+                raise DownloadError(f"Ошибка загрузки {url}: {e}") from e
+
+    async def _get_page(self, url: str) -> PageScanner:
+        """Получение и разбор страницы сайта."""
+        async with self.limiter(url):
+            async with self._session.get(url) as response:
+                response.raise_for_status()
+                return scan_page(await response.text(), str(response.url))
+
+    def _submit(
+        self,
+        form: Form,
+        headers: Optional[dict[str, str]] = None,
+        clicked: Optional[str] = None,
+        **values: str,
+    ):
+        """Отправка формы с заполненными полями."""
+        fields = {**form.fields, **values}
+        if clicked:
+            fields[clicked] = form.controls[clicked]
+        if form.method == "post":
+            return self._session.post(form.action, data=fields, headers=headers)
+        return self._session.get(form.action, params=fields, headers=headers)
+
+    async def _save(
+        self, record: DownloadRecord, response: aiohttp.ClientResponse
+    ) -> str:
+        """
+        Потоковая запись ответа во временный каталог загрузки и перенос в каталог выпусков.
+        Если сервер ответил на запрос докачки (206), запись продолжается с места обрыва.
+        """
+        staged_path = record.staging_dir / self._get_filename(response)
+        part_path = staged_path.with_name(f"{staged_path.name}.part")
+
+        partial_path = record.partial_path()
+        resumed = response.status == 206 and partial_path == part_path
+        if partial_path and not resumed:
+            partial_path.unlink()
+
+        with open(part_path, "ab" if resumed else "wb") as file:
+            async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                file.write(chunk)
+        os.replace(part_path, staged_path)
+
+        filename = self.manifest.complete(record, staged_path)
+        logger.debug(f"Загружен файл {filename}{' (докачан)' if resumed else ''}")
+        return filename
+
+    @staticmethod
+    def _get_filename(response: aiohttp.ClientResponse) -> str:
+        """Имя файла из Content-Disposition или из адреса ответа."""
+        filename = None
+        if response.content_disposition:
+            filename = response.content_disposition.filename
+        if not filename:
+            filename = unquote(os.path.basename(urlsplit(str(response.url)).path))
+        if not (filename := os.path.basename(filename or "")):
+            raise DownloadError(f"Не удалось определить имя файла для {response.url}")
+        return filename
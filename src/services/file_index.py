@@ -0,0 +1,140 @@
+import asyncio
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+from src.core.constants import FILE_INDEX_RESCAN_SECONDS
+from src.core.logger import logger
+from src.core.paths import BROADCASTS_DIR, COMPACT_DIR_NAME
+from src.services.watcher import (
+    IN_CLOSE_WRITE,
+    IN_DELETE,
+    IN_ISDIR,
+    IN_MOVED_FROM,
+    IN_MOVED_TO,
+    DirectoryWatcher,
+    is_partial,
+)
+
+
+@dataclass(slots=True)
+class FileInfo:
+    """Файл выпуска в индексе."""
+
+    path: Path
+    size: int
+    mtime: float
+
+
+class FileIndex:
+    """
+    Индекс файлов каталога выпусков в памяти.
+
+    Строится один раз и поддерживается в актуальном состоянии
+    по событиям inotify, поэтому поиск файла не обращается к диску.
+    Учитываются сам каталог и подкаталог перекодированных копий.
+    Если inotify недоступен, индекс перестраивается раз в `rescan_interval`.
+    """
+
+    def __init__(
+        self,
+        directory: Path = BROADCASTS_DIR,
+        rescan_interval: float = FILE_INDEX_RESCAN_SECONDS,
+    ):
+        self.directory = Path(directory)
+        self.rescan_interval = rescan_interval
+        self._files: dict[str, FileInfo] = {}
+        self._ready = False
+        self._watcher: Optional[DirectoryWatcher] = None
+        self._rescanner: Optional[asyncio.Task] = None
+
+    @property
+    def ready(self) -> bool:
+        """Индекс построен и отслеживает изменения."""
+        return self._ready
+
+    def __len__(self) -> int:
+        return len(self._files)
+
+    def get(self, name: str) -> Optional[FileInfo]:
+        """Файл по имени относительно каталога выпусков."""
+        return self._files.get(name)
+
+    def missing(self, names: Iterable[Optional[str]]) -> list[str]:
+        """Имена из списка, которых нет на диске."""
+        return [name for name in names if name and name not in self._files]
+
+    async def start(self) -> None:
+        """Построение индекса и подписка на изменения каталога."""
+        os.makedirs(self.directory / COMPACT_DIR_NAME, exist_ok=True)
+        self._scan()
+        try:
+            self._watcher = DirectoryWatcher(self._on_event)
+            for directory in self._directories():
+                self._watcher.add(directory)
+        except OSError as e:
+            logger.warning(f"Индекс файлов обновляется пересканированием: {e}")
+            if self._watcher:
+                self._watcher.close()
+                self._watcher = None
+            self._rescanner = asyncio.create_task(self._rescan())
+        self._ready = True
+        logger.info(f"Индекс файлов построен: {len(self._files)} файлов")
+
+    def stop(self) -> None:
+        """Отписка от изменений каталога."""
+        self._ready = False
+        if self._watcher:
+            self._watcher.close()
+            self._watcher = None
+        if self._rescanner:
+            self._rescanner.cancel()
+            self._rescanner = None
+
+    def _directories(self) -> tuple[Path, Path]:
+        return self.directory, self.directory / COMPACT_DIR_NAME
+
+    def _key(self, directory: Path, name: str) -> str:
+        """Имя файла относительно каталога выпусков."""
+        if directory == self.directory:
+            return name
+        return f"{directory.relative_to(self.directory).as_posix()}/{name}"
+
+    def _scan(self) -> None:
+        """Полное построение индекса."""
+        files = {}
+        for directory in self._directories():
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_file() and not is_partial(entry.name):
+                        stat = entry.stat()
+                        files[self._key(directory, entry.name)] = FileInfo(
+                            Path(entry.path), stat.st_size, stat.st_mtime
+                        )
+        self._files = files
+
+    def _on_event(self, directory: Path, name: str, mask: int) -> None:
+        """Обновление индекса по событию файловой системы."""
+        if mask & IN_ISDIR or is_partial(name):
+            return
+        key = self._key(directory, name)
+        if mask & (IN_DELETE | IN_MOVED_FROM):
+            self._files.pop(key, None)
+        elif mask & (IN_CLOSE_WRITE | IN_MOVED_TO):
+            path = directory / name
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                self._files.pop(key, None)
+                return
+            self._files[key] = FileInfo(path, stat.st_size, stat.st_mtime)
+
+    async def _rescan(self) -> None:
+        """Запасной вариант без inotify: периодическое перестроение."""
+        while True:
+            await asyncio.sleep(self.rescan_interval)
+            await asyncio.to_thread(self._scan)
+
+
+file_index = FileIndex()
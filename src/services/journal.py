@@ -0,0 +1,107 @@
+import json
+import os
+from pathlib import Path
+from typing import Any, Optional
+
+from src.core.logger import logger
+from src.core.paths import JOURNAL_PATH
+from src.utils.enums import LinkState
+
+
+class CrawlJournal:
+    """
+    Журнал состояний ссылок парсера (дописывается построчно в JSON Lines).
+
+    Каждая строка фиксирует переход ссылки в новое состояние:
+    discovered -> downloading -> downloaded -> persisted.
+    После сбоя следующий запуск продолжает с последнего записанного состояния.
+    """
+
+    def __init__(self, path: Path = JOURNAL_PATH):
+        self.path = Path(path)
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._file = None
+
+    def __enter__(self) -> "CrawlJournal":
+        self._load()
+        os.makedirs(self.path.parent, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+        if self._file.tell() and not self._ends_with_newline():
+            # последняя строка оборвана - новые записи начинаются с новой строки
+            self._file.write("\n")
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def state(self, url: str) -> Optional[LinkState]:
+        """Последнее записанное состояние ссылки."""
+        if entry := self._entries.get(url):
+            return LinkState(entry["state"])
+        return None
+
+    def get(self, url: str, key: str) -> Any:
+        """Значение, записанное вместе с состоянием ссылки."""
+        return self._entries.get(url, {}).get(key)
+
+    def urls(self, state: LinkState) -> list[str]:
+        """Ссылки в заданном состоянии."""
+        return [
+            url for url, entry in self._entries.items() if entry["state"] == state
+        ]
+
+    def record(self, url: str, state: LinkState, **data: Any) -> None:
+        """Запись перехода ссылки в новое состояние."""
+        self.record_many([url], state, **data)
+
+    def record_many(self, urls: list[str], state: LinkState, **data: Any) -> None:
+        """Запись перехода нескольких ссылок в одно состояние одной операцией."""
+        lines = []
+        for url in urls:
+            entry = {"url": url, "state": state.value, **data}
+            self._entries[url] = entry
+            lines.append(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.writelines(lines)
+        self._file.flush()
+
+    def compact(self) -> None:
+        """
+        Перезапись журнала после завершения обхода: остаются только
+        ссылки, которые так и не были сохранены в каталог.
+        """
+        unfinished = {
+            url: entry
+            for url, entry in self._entries.items()
+            if entry["state"] != LinkState.PERSISTED
+        }
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            for entry in unfinished.values():
+                file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.close()
+        os.replace(tmp_path, self.path)
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._entries = unfinished
+
+    def _load(self) -> None:
+        """Восстановление последних состояний ссылок из журнала."""
+        if not os.path.isfile(self.path):
+            return
+        with open(self.path, encoding="utf-8") as file:
+            for line_number, line in enumerate(file, 1):
+                try:
+                    entry = json.loads(line)
+                    self._entries[entry["url"]] = entry
+                except (ValueError, KeyError):
+                    # строка могла оборваться при аварийном завершении
+                    logger.warning(f"Пропущена поврежденная запись журнала: {line_number}")
+        if self._entries:
+            logger.info(f"Журнал парсера: восстановлено ссылок {len(self._entries)}")
+
+    def _ends_with_newline(self) -> bool:
+        """Журнал заканчивается целой строкой."""
+        with open(self.path, "rb") as file:
+            file.seek(-1, os.SEEK_END)
+            return file.read(1) == b"\n"
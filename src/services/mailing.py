@@ -0,0 +1,120 @@
+from aiogram import Bot
+from aiogram.exceptions import TelegramAPIError, TelegramForbiddenError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.bot.middlewares.scheduler import priority
+from src.bot.utils.send_message import notify_admin
+from src.core.constants import DEFAULT_AUDIO_PERFORMER, MAILING_PAGE_SIZE
+from src.core.logger import logger
+from src.database.models.mailing import Mailing
+from src.database.repo.requests import RequestsRepo
+from src.services.audio import FILE_ID_FIELDS, get_audio_title
+from src.services.catalog import CatalogEntry, catalog
+from src.utils.enums import SendPriority
+
+
+class MailingService:
+    """
+    Рассылка новых выпусков всем пользователям.
+
+    Получатели читаются страницами по `page_size` (keyset по id), поэтому
+    таблица пользователей не загружается целиком. Перед отправкой каждому
+    пользователю позиция рассылки сохраняется в БД: после сбоя рассылка
+    продолжается со следующего пользователя и никому не приходит дважды.
+    Сессии открываются только на чтение страницы и запись позиции,
+    соединение не занято на время отправок.
+    Выпуск отправляется по сохраненному file_id с фоновым приоритетом,
+    чтобы не задерживать ответы пользователям.
+    """
+
+    def __init__(
+        self,
+        bot: Bot,
+        session_pool: async_sessionmaker,
+        page_size: int = MAILING_PAGE_SIZE,
+    ):
+        self._bot = bot
+        self._session_pool = session_pool
+        self.page_size = page_size
+
+    async def run(self) -> None:
+        """Выполнение всех незавершенных рассылок."""
+        async with self._session_pool() as session:
+            repo = RequestsRepo(session)
+            mailings = await repo.mailings.get_unfinished()
+            await catalog.ensure_loaded(repo)
+
+        with priority(SendPriority.BACKGROUND):
+            for mailing in mailings:
+                await self._run_mailing(mailing)
+
+    async def _run_mailing(self, mailing: Mailing) -> None:
+        """Рассылка одного выпуска с места последней остановки."""
+        broadcast = catalog.get(mailing.broadcast_id)
+        if broadcast and not all(
+            getattr(broadcast, field) for field in FILE_ID_FIELDS.values()
+        ):
+            logger.warning(
+                f"Рассылка {mailing.id} отложена: у выпуска "
+                f"{mailing.broadcast_id} нет file_id"
+            )
+            return
+
+        while broadcast and (page := await self._get_page(mailing)):
+            for user_id, telegram_id, show_role_name in page:
+                mailing.last_user_id = user_id
+                await self._save_progress(mailing)
+                await self._send(mailing, broadcast, telegram_id, show_role_name)
+        async with self._session_pool() as session:
+            await RequestsRepo(session).mailings.finish(mailing)
+
+        report = (
+            f"Рассылка выпуска {mailing.broadcast_id} завершена: "
+            f"доставлено {mailing.sent}, заблокировали бота {mailing.blocked}, "
+            f"ошибок {mailing.failed}"
+        )
+        logger.info(report)
+        await notify_admin(text=report)
+
+    async def _get_page(self, mailing: Mailing) -> list:
+        """Следующая страница получателей; сессия не держится на время отправок."""
+        async with self._session_pool() as session:
+            return await RequestsRepo(session).users.get_recipients(
+                mailing.last_user_id, self.page_size
+            )
+
+    async def _save_progress(self, mailing: Mailing) -> None:
+        """Сохранение позиции рассылки до отправки очередному получателю."""
+        async with self._session_pool() as session:
+            await RequestsRepo(session).mailings.update_by_id(
+                mailing.id,
+                {
+                    "last_user_id": mailing.last_user_id,
+                    "sent": mailing.sent,
+                    "blocked": mailing.blocked,
+                    "failed": mailing.failed,
+                },
+            )
+
+    async def _send(
+        self,
+        mailing: Mailing,
+        broadcast: CatalogEntry,
+        chat_id: int,
+        use_alt: bool,
+    ) -> None:
+        """Отправка выпуска одному пользователю с учетом результата."""
+        try:
+            await self._bot.send_audio(
+                chat_id=chat_id,
+                audio=getattr(broadcast, FILE_ID_FIELDS[use_alt]),
+                title=get_audio_title(broadcast, use_alt),
+                performer=DEFAULT_AUDIO_PERFORMER,
+                duration=broadcast.duration,
+            )
+            mailing.sent += 1
+        except TelegramForbiddenError:
+            mailing.blocked += 1
+        except TelegramAPIError as e:
+            logger.warning(f"Рассылка {mailing.id}: ошибка отправки {chat_id}: {e}")
+            mailing.failed += 1
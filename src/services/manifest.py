@@ -0,0 +1,105 @@
+import hashlib
+import os
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Optional
+
+from src.core.exceptions import FileManagerError
+from src.services.watcher import is_partial
+
+STAGING_DIR_NAME = ".staging"
+
+
+@dataclass
+class DownloadRecord:
+    """Загрузка одной ссылки: свой временный каталог и итоговый файл."""
+
+    url: str
+    staging_dir: Path
+    filename: Optional[str] = None
+
+    def partial_path(self) -> Optional[Path]:
+        """Недокачанный файл, оставшийся от прошлого запуска."""
+        with os.scandir(self.staging_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and is_partial(entry.name):
+                    return Path(entry.path)
+        return None
+
+
+class DownloadManifest:
+    """
+    Соответствие ссылок и загруженных по ним файлов.
+
+    Каждая загрузка идет в собственный временный подкаталог, поэтому
+    параллельные загрузки не путаются между собой. После завершения файл
+    переносится в общий каталог под уникальным именем.
+    Имя подкаталога выводится из ссылки, так что после перезапуска
+    недокачанный файл находится на прежнем месте.
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.staging_root = self.directory / STAGING_DIR_NAME
+        self._records: dict[str, DownloadRecord] = {}
+
+    def __getitem__(self, url: str) -> DownloadRecord:
+        return self._records[url]
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._records
+
+    def start(self, url: str, clean: bool = False) -> DownloadRecord:
+        """
+        Регистрация загрузки и создание ее временного каталога.
+
+        :param clean: Удалить недокачанные файлы прошлого запуска
+        """
+        record = DownloadRecord(url=url, staging_dir=self.staging_root / _url_key(url))
+        if clean:
+            shutil.rmtree(record.staging_dir, ignore_errors=True)
+        os.makedirs(record.staging_dir, exist_ok=True)
+        self._records[url] = record
+        return record
+
+    def cleanup(self, keep: Iterable[str] = ()) -> None:
+        """Удаление временных каталогов всех загрузок, кроме ссылок из `keep`."""
+        if not os.path.isdir(self.staging_root):
+            return
+        keep_keys = {_url_key(url) for url in keep}
+        with os.scandir(self.staging_root) as entries:
+            for entry in entries:
+                if entry.name not in keep_keys:
+                    shutil.rmtree(entry.path, ignore_errors=True)
+
+    def complete(self, record: DownloadRecord, staged_path: Path) -> str:
+        """Перенос загруженного файла в общий каталог. Возвращает имя файла."""
+        try:
+            file_path = self._unique_path(Path(staged_path).name)
+            os.replace(staged_path, file_path)
+        except OSError as e:
+            raise FileManagerError(f"Ошибка переноса файла {staged_path}: {e}") from e
+        finally:
+            shutil.rmtree(record.staging_dir, ignore_errors=True)
+        record.filename = file_path.name
+        return record.filename
+
+    def discard(self, record: DownloadRecord) -> None:
+        """Удаление временного каталога неудавшейся загрузки."""
+        shutil.rmtree(record.staging_dir, ignore_errors=True)
+        self._records.pop(record.url, None)
+
+    def _unique_path(self, filename: str) -> Path:
+        """Путь в общем каталоге, не занятый другим выпуском."""
+        path = self.directory / filename
+        counter = 1
+        while os.path.exists(path):
+            path = self.directory / f"{Path(filename).stem} ({counter}){Path(filename).suffix}"
+            counter += 1
+        return path
+
+
+def _url_key(url: str) -> str:
+    """Имя временного каталога загрузки для ссылки."""
+    return hashlib.sha1(url.encode()).hexdigest()[:16]
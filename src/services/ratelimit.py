@@ -0,0 +1,114 @@
+import asyncio
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+from urllib.parse import urlsplit
+
+from src.core.config import settings
+from src.core.constants import MIN_REQUEST_RATE, SLOW_RESPONSE_SECONDS
+from src.core.logger import logger
+
+
+class TokenBucket:
+    """
+    Адаптивный токен-бакет одного хоста.
+
+    Скорость растет на `increase` запросов в секунду после каждого
+    быстрого ответа и уменьшается вдвое после ошибки или медленного ответа.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        max_rate: float,
+        min_rate: float = MIN_REQUEST_RATE,
+        increase: float = 0.1,
+    ):
+        self.rate = rate
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.increase = increase
+        self.capacity = max(1.0, rate)
+        self._tokens = 1.0
+        self._updated = asyncio.get_running_loop().time()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Ожидание токена на один запрос."""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def reward(self) -> None:
+        """Аддитивное увеличение скорости после успешного ответа."""
+        self.rate = min(self.max_rate, self.rate + self.increase)
+        self.capacity = max(1.0, self.rate)
+
+    def penalize(self) -> None:
+        """Мультипликативное снижение скорости после ошибки."""
+        self._refill()
+        self.rate = max(self.min_rate, self.rate / 2)
+        self.capacity = max(1.0, self.rate)
+        self._tokens = min(self._tokens, 0.0)
+
+    def _refill(self) -> None:
+        """Начисление токенов за прошедшее время."""
+        now = asyncio.get_running_loop().time()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+
+class HostLimiter:
+    """
+    Ограничение запросов к одному хосту: число одновременных запросов
+    и их частота. Частота подстраивается под ответы сервера.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        rate: float = settings.PARSER.RATE,
+        max_rate: float = settings.PARSER.MAX_RATE,
+        slow_threshold: float = SLOW_RESPONSE_SECONDS,
+    ):
+        self.limit = limit
+        self.rate = rate
+        self.max_rate = max_rate
+        self.slow_threshold = slow_threshold
+        self._semaphores: defaultdict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self.limit)
+        )
+        self._buckets: dict[str, TokenBucket] = {}
+
+    @asynccontextmanager
+    async def __call__(self, url: str) -> AsyncIterator[None]:
+        """
+        Слот запроса к хосту, к которому относится адрес.
+        Ошибка внутри блока или его долгое выполнение снижают частоту запросов.
+        """
+        host = urlsplit(url).netloc
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(self.rate, self.max_rate)
+        bucket = self._buckets[host]
+
+        async with self._semaphores[host]:
+            await bucket.acquire()
+            loop = asyncio.get_running_loop()
+            start_time = loop.time()
+            try:
+                yield
+            except Exception:
+                bucket.penalize()
+                logger.debug(f"Частота запросов к {host} снижена до {bucket.rate:.2f}/с")
+                raise
+            if loop.time() - start_time > self.slow_threshold:
+                bucket.penalize()
+                logger.debug(f"Медленный ответ {host}, частота {bucket.rate:.2f}/с")
+            else:
+                bucket.reward()
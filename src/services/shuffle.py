@@ -0,0 +1,50 @@
+import random
+from typing import Optional
+
+from src.database.models.user import User
+from src.database.repo.requests import RequestsRepo
+from src.services.catalog import CatalogEntry, catalog
+from src.utils.shuffle import permute
+
+
+class ShuffleBag:
+    """
+    Очередь выпусков пользователя без повторов.
+
+    Пользователь проходит каталог в порядке собственной псевдослучайной
+    перестановки; повтор возможен только после прохода всего каталога.
+    Переставляются id выпусков, а не позиции в кэше каталога: позиции
+    сдвигаются, когда при перезагрузке из середины каталога выпадают выпуски,
+    а id - нет. В БД хранятся три числа: ключ перестановки, позиция
+    и наибольший id выпуска в начале прохода. Выпуски, добавленные
+    во время прохода, попадают в следующий, удаленные пропускаются.
+    """
+
+    def __init__(self, user: User, repo: RequestsRepo):
+        self._user = user
+        self._repo = repo
+
+    async def next(self) -> Optional[CatalogEntry]:
+        """Следующий выпуск очереди пользователя."""
+        await catalog.ensure_loaded(self._repo)
+        if not len(catalog):
+            return None
+
+        seed = self._user.shuffle_seed
+        cursor = self._user.shuffle_cursor
+        size = self._user.shuffle_size
+
+        entry = None
+        while entry is None:
+            if cursor >= size:
+                seed, cursor, size = random.getrandbits(63), 0, catalog.max_id
+            broadcast_id = permute(cursor, size, seed) + 1
+            cursor += 1
+            # выпуска могло не быть или он удален после начала прохода
+            entry = catalog.get(broadcast_id)
+
+        await self._repo.users.update_user(
+            self._user,
+            {"shuffle_seed": seed, "shuffle_cursor": cursor, "shuffle_size": size},
+        )
+        return entry
@@ -0,0 +1,63 @@
+from dataclasses import dataclass
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.database.repo.requests import RequestsRepo
+
+_UNITS = ("Б", "КБ", "МБ", "ГБ", "ТБ")
+
+
+def format_size(size: float) -> str:
+    """Размер в байтах в удобочитаемом виде."""
+    for unit in _UNITS[:-1]:
+        if size < 1024:
+            return f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} {_UNITS[-1]}"
+
+
+@dataclass
+class StorageReport:
+    """
+    Сводка по хранилищу выпусков и исходящему трафику.
+
+    Строится по сохраненным метаданным файлов, без чтения самих файлов.
+    Объем загрузок - оценка сверху: перекодированные копии меньше исходных.
+    """
+
+    files: int
+    total_size: int
+    total_duration: int
+    pending_upload_size: int
+
+    @property
+    def average_size(self) -> float:
+        """Средний размер файла, байты."""
+        return self.total_size / self.files if self.files else 0
+
+    @property
+    def average_bitrate(self) -> float:
+        """Средний битрейт по всему каталогу, бит/с."""
+        return self.total_size * 8 / self.total_duration if self.total_duration else 0
+
+    @property
+    def hourly_traffic(self) -> float:
+        """Трафик на час прослушивания, байты."""
+        return self.average_bitrate / 8 * 3600
+
+    def __str__(self) -> str:
+        return (
+            f"файлов {self.files}, объем {format_size(self.total_size)} "
+            f"(в среднем {format_size(self.average_size)}), "
+            f"длительность {self.total_duration / 3600:.1f} ч, "
+            f"битрейт {self.average_bitrate / 1000:.0f} кбит/с; "
+            f"трафик на час прослушивания {format_size(self.hourly_traffic)}, "
+            f"ожидают загрузки {format_size(self.pending_upload_size)}"
+        )
+
+
+async def get_storage_report(session_pool: async_sessionmaker) -> StorageReport:
+    """Сводка по хранилищу выпусков из БД."""
+    async with session_pool() as session:
+        stats = await RequestsRepo(session).broadcasts.get_storage_stats()
+    return StorageReport(*stats)
@@ -0,0 +1,132 @@
+import asyncio
+import os
+import shutil
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.core.config import settings
+from src.core.logger import logger
+from src.core.paths import BROADCASTS_DIR, COMPACT_DIR_NAME
+from src.database.repo.requests import RequestsRepo
+from src.services.catalog import catalog
+
+
+class Transcoder:
+    """
+    Перекодирование выпусков в компактный формат через ffmpeg.
+
+    Оригинал остается на месте, копия сохраняется в подкаталог
+    `compact` и записывается всем выпускам с этим файлом.
+    Каждый файл перекодируется один раз, даже если он общий
+    для нескольких выпусков. Копия, которая
+    не меньше оригинала, не сохраняется. Число одновременно
+    запущенных кодировщиков ограничено `concurrency`.
+    """
+
+    def __init__(
+        self,
+        directory: Path = BROADCASTS_DIR,
+        codec: str = settings.TRANSCODE.CODEC,
+        bitrate: str = settings.TRANSCODE.BITRATE,
+        extension: str = settings.TRANSCODE.EXTENSION,
+        output_format: str = settings.TRANSCODE.FORMAT,
+        concurrency: int = settings.TRANSCODE.CONCURRENCY,
+    ):
+        self.directory = Path(directory)
+        self.codec = codec
+        self.bitrate = bitrate
+        self.extension = extension
+        self.output_format = output_format
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._ffmpeg = shutil.which("ffmpeg")
+
+    @property
+    def available(self) -> bool:
+        """Кодировщик установлен в системе."""
+        return self._ffmpeg is not None
+
+    async def run(self, session_pool: async_sessionmaker) -> int:
+        """Перекодирование всех выпусков без копии. Возвращает число копий."""
+        if not self.available:
+            logger.warning("Перекодирование пропущено: ffmpeg не найден")
+            return 0
+
+        async with session_pool() as session:
+            filenames = await RequestsRepo(session).broadcasts.get_untranscoded()
+        if not filenames:
+            return 0
+
+        logger.info(f"Перекодирование файлов: {len(filenames)}")
+        results = await asyncio.gather(
+            *(self._transcode_file(session_pool, filename) for filename in filenames)
+        )
+        logger.info(f"Перекодировано файлов: {sum(results)} из {len(filenames)}")
+        return sum(results)
+
+    async def _transcode_file(
+        self, session_pool: async_sessionmaker, filename: str
+    ) -> bool:
+        """Перекодирование файла и запись копии всем выпускам с этим файлом."""
+        if not (compact_name := await self.transcode(filename)):
+            return False
+        async with session_pool() as session:
+            updated = await RequestsRepo(session).broadcasts.update_compact_filename(
+                filename, compact_name
+            )
+        for broadcast_id in updated:
+            catalog.update(broadcast_id, compact_filename=compact_name)
+        return True
+
+    async def transcode(self, filename: str) -> Optional[str]:
+        """
+        Перекодирование одного файла.
+        Возвращает путь копии относительно каталога выпусков.
+        """
+        source = self.directory / filename
+        if not os.path.isfile(source):
+            logger.error(f"Аудиофайл не найден: {source}")
+            return None
+
+        # полное имя оригинала уникально, основа имени - нет (role.mp3 и role.m4a)
+        compact_name = f"{COMPACT_DIR_NAME}/{filename}.{self.extension}"
+        target = self.directory / compact_name
+        temp_path = target.with_name(f"{target.name}.part")
+        os.makedirs(target.parent, exist_ok=True)
+
+        async with self._semaphore:
+            process = await asyncio.create_subprocess_exec(
+                self._ffmpeg,
+                "-nostdin",
+                "-y",
+                "-loglevel",
+                "error",
+                "-i",
+                str(source),
+                "-map",
+                "0:a",
+                "-c:a",
+                self.codec,
+                "-b:a",
+                self.bitrate,
+                # временный файл с суффиксом .part, формат по имени не определяется
+                "-f",
+                self.output_format,
+                str(temp_path),
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            _, stderr = await process.communicate()
+
+        if process.returncode != 0:
+            temp_path.unlink(missing_ok=True)
+            logger.error(f"Ошибка перекодирования {filename}: {stderr.decode().strip()}")
+            return None
+        if os.path.getsize(temp_path) >= os.path.getsize(source):
+            temp_path.unlink()
+            logger.debug(f"Копия {filename} не меньше оригинала, пропущена")
+            return None
+
+        os.replace(temp_path, target)
+        return compact_name
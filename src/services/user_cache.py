@@ -0,0 +1,49 @@
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from src.core.constants import USER_CACHE_SIZE, USER_CACHE_TTL
+from src.database.models.user import User
+
+
+class UserCache:
+    """
+    Кэш пользователей по telegram_id с ограничением размера (LRU) и времени жизни.
+
+    Хранит отсоединенные от сессии объекты User; изменения пользователя
+    записываются в БД через `UserRepo.update_user`, который обновляет
+    и сам объект в кэше.
+    """
+
+    def __init__(self, maxsize: int = USER_CACHE_SIZE, ttl: float = USER_CACHE_TTL):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._users: OrderedDict[int, tuple[float, User]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._users)
+
+    def get(self, telegram_id: int) -> Optional[User]:
+        """Пользователь из кэша, если запись не устарела."""
+        if (item := self._users.get(telegram_id)) is None:
+            return None
+        expires_at, user = item
+        if expires_at < time.monotonic():
+            del self._users[telegram_id]
+            return None
+        self._users.move_to_end(telegram_id)
+        return user
+
+    def put(self, user: User) -> None:
+        """Сохранение пользователя с вытеснением давно не используемых."""
+        self._users[user.telegram_id] = (time.monotonic() + self.ttl, user)
+        self._users.move_to_end(user.telegram_id)
+        while len(self._users) > self.maxsize:
+            self._users.popitem(last=False)
+
+    def discard(self, telegram_id: int) -> None:
+        """Удаление пользователя из кэша."""
+        self._users.pop(telegram_id, None)
+
+
+user_cache = UserCache()
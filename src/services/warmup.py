@@ -0,0 +1,106 @@
+import asyncio
+
+from aiogram import Bot
+from aiogram.exceptions import TelegramAPIError, TelegramRetryAfter
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.bot.middlewares.scheduler import priority
+from src.core.config import settings
+from src.core.exceptions import DatabaseError
+from src.core.logger import logger
+from src.database.repo.requests import RequestsRepo
+from src.services.audio import (
+    FILE_ID_FIELDS,
+    AudioSender,
+    FileIDManager,
+    get_audio_title,
+)
+from src.services.filemanager import file_manager
+from src.utils.enums import SendPriority
+
+
+class FileIDWarmer:
+    """
+    Фоновая загрузка выпусков без file_id в служебный чат.
+
+    Каждый недостающий вариант (с именем роли и без) загружается один раз,
+    полученный file_id сохраняется в БД. Соединение с БД на время загрузки
+    не занимается. После прогрева /show отправляет
+    выпуски по file_id, без загрузки файла в момент запроса.
+    """
+
+    def __init__(
+        self,
+        bot: Bot,
+        session_pool: async_sessionmaker,
+        chat_id: int = settings.TELEGRAM.ADMIN_CHAT_ID,
+        concurrency: int = settings.TELEGRAM.WARMUP_CONCURRENCY,
+    ):
+        self._bot = bot
+        self._session_pool = session_pool
+        self._chat_id = chat_id
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(self) -> int:
+        """Прогрев всех выпусков без file_id. Возвращает число загрузок."""
+        async with self._session_pool() as session:
+            broadcasts = await RequestsRepo(session).broadcasts.get_missing_file_ids()
+
+        jobs = [
+            (broadcast.id, use_alt)
+            for broadcast in broadcasts
+            for use_alt, field in FILE_ID_FIELDS.items()
+            if getattr(broadcast, field) is None
+        ]
+        if not jobs:
+            return 0
+
+        logger.info(f"Прогрев file_id: {len(jobs)} загрузок")
+        # загрузки пропускают вперед ответы пользователям
+        with priority(SendPriority.BACKGROUND):
+            results = await asyncio.gather(
+                *(self._warm(broadcast_id, use_alt) for broadcast_id, use_alt in jobs)
+            )
+        logger.info(f"Прогрев file_id завершен: загружено {sum(results)} из {len(jobs)}")
+        return sum(results)
+
+    async def _warm(self, broadcast_id: int, use_alt: bool) -> bool:
+        """Загрузка одного варианта выпуска и сохранение его file_id."""
+        async with self._semaphore, self._session_pool() as session:
+            repo = RequestsRepo(session)
+            broadcast = await repo.broadcasts.get(broadcast_id)
+            # соединение возвращается в пул до загрузки: file_id записывается
+            # отдельным заданием, выпуск после закрытия сессии остается загруженным
+            await session.close()
+            # file_id мог появиться, пока выпуск ждал очереди
+            if not broadcast or getattr(broadcast, FILE_ID_FIELDS[use_alt]):
+                return False
+
+            sender = AudioSender(
+                bot=self._bot,
+                file_manager=file_manager,
+                file_id_manager=FileIDManager(repo=repo, broadcast=broadcast),
+            )
+            while True:
+                try:
+                    message, shared = await sender.upload_once(
+                        chat_id=self._chat_id,
+                        filename=broadcast.filename,
+                        use_alt=use_alt,
+                        title=get_audio_title(broadcast, use_alt),
+                    )
+                    break
+                except TelegramRetryAfter as e:
+                    await asyncio.sleep(e.retry_after)
+                except (FileNotFoundError, TelegramAPIError, DatabaseError) as e:
+                    logger.error(f"Прогрев выпуска {broadcast_id} не удался: {e!r}")
+                    return False
+
+            # общий результат - сообщение пользователя, оно остается
+            if shared:
+                return False
+            try:
+                await message.delete()
+            except TelegramAPIError:
+                pass
+            return True
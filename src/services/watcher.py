@@ -0,0 +1,220 @@
+import asyncio
+import ctypes
+import ctypes.util
+import os
+import struct
+from pathlib import Path
+from typing import Callable, Optional
+
+from src.core.logger import logger
+
+# флаги inotify из <sys/inotify.h>
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+# суффиксы незавершенных загрузок (Chrome и HttpDownloader)
+PARTIAL_SUFFIXES = (".crdownload", ".part")
+
+WatchCallback = Callable[[Path, str, int], None]
+
+
+def _load_inotify() -> Optional[ctypes.CDLL]:
+    """Загрузка inotify из libc, если платформа его поддерживает."""
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        libc.inotify_init1, libc.inotify_add_watch, libc.inotify_rm_watch
+        return libc
+    except (OSError, AttributeError, TypeError):
+        return None
+
+
+_libc = _load_inotify()
+
+
+def is_partial(name: str) -> bool:
+    """Файл еще загружается."""
+    return name.endswith(PARTIAL_SUFFIXES)
+
+
+def final_name(name: str) -> str:
+    """Имя файла после завершения загрузки."""
+    for suffix in PARTIAL_SUFFIXES:
+        name = name.removesuffix(suffix)
+    return name
+
+
+class DirectoryWatcher:
+    """
+    Наблюдение за каталогами через inotify.
+
+    Для каждого события вызывает `callback(directory, name, mask)`
+    в цикле событий asyncio. Стоимость не зависит от числа файлов в каталоге.
+    """
+
+    MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_MOVED_FROM | IN_CREATE | IN_DELETE
+
+    def __init__(self, callback: WatchCallback):
+        if _libc is None:
+            raise OSError("inotify недоступен на этой платформе")
+        self._callback = callback
+        self._directories: dict[int, Path] = {}
+        self._loop = asyncio.get_running_loop()
+        self._fd = _libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "Ошибка inotify_init1")
+        self._loop.add_reader(self._fd, self._read_events)
+
+    def add(self, directory: Path) -> None:
+        """Добавление каталога под наблюдение."""
+        wd = _libc.inotify_add_watch(self._fd, os.fsencode(directory), self.MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"Ошибка наблюдения за {directory}")
+        self._directories[wd] = Path(directory)
+
+    def remove(self, directory: Path) -> None:
+        """Снятие каталога с наблюдения."""
+        for wd, path in list(self._directories.items()):
+            if path == Path(directory):
+                _libc.inotify_rm_watch(self._fd, wd)
+                del self._directories[wd]
+
+    def close(self) -> None:
+        """Закрытие дескриптора inotify."""
+        if self._fd >= 0:
+            self._loop.remove_reader(self._fd)
+            os.close(self._fd)
+            self._fd = -1
+
+    def _read_events(self) -> None:
+        """Чтение и разбор пачки событий inotify."""
+        try:
+            data = os.read(self._fd, _READ_SIZE)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+            if (directory := self._directories.get(wd)) and name:
+                self._callback(directory, name, mask)
+
+
+class DownloadTracker:
+    """
+    Отслеживание завершения загрузок по событиям файловой системы.
+
+    `wait_for` возвращает future, который завершается в момент, когда файл
+    появился в каталоге под окончательным именем. Если inotify недоступен,
+    раз в `poll_interval` проверяются только ожидаемые файлы.
+    """
+
+    def __init__(self, directory: Path, poll_interval: float = 1):
+        self.directory = Path(directory)
+        self.poll_interval = poll_interval
+        self._pending: dict[Path, asyncio.Future] = {}
+        self._pending_dirs: dict[Path, asyncio.Future] = {}
+        self._watcher: Optional[DirectoryWatcher] = None
+        self._poller: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "DownloadTracker":
+        os.makedirs(self.directory, exist_ok=True)
+        try:
+            self._watcher = DirectoryWatcher(self._on_event)
+            self._watcher.add(self.directory)
+        except OSError as e:
+            logger.warning(f"Наблюдение за загрузками опросом каталога: {e}")
+            self._watcher = None
+            self._poller = asyncio.create_task(self._poll())
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        if self._watcher:
+            self._watcher.close()
+        if self._poller:
+            self._poller.cancel()
+        for future in [*self._pending.values(), *self._pending_dirs.values()]:
+            future.cancel()
+        self._pending.clear()
+        self._pending_dirs.clear()
+
+    @property
+    def pending(self) -> int:
+        """Число незавершенных загрузок."""
+        return len(self._pending) + len(self._pending_dirs)
+
+    def wait_for(self, filename: str) -> asyncio.Future:
+        """Future, завершающийся путем к файлу после окончания его загрузки."""
+        path = self.directory / filename
+        if (future := self._pending.get(path)) and not future.done():
+            return future
+
+        future = asyncio.get_running_loop().create_future()
+        # файл мог появиться до регистрации ожидания
+        if os.path.isfile(path):
+            future.set_result(path)
+            return future
+        self._pending[path] = future
+        return future
+
+    def wait_for_any(self, directory: Path) -> asyncio.Future:
+        """
+        Future, завершающийся путем к первому загруженному файлу
+        в отдельном каталоге загрузки.
+        """
+        directory = Path(directory)
+        future = asyncio.get_running_loop().create_future()
+        self._pending_dirs[directory] = future
+        if self._watcher:
+            self._watcher.add(directory)
+        # загрузка могла завершиться до регистрации ожидания
+        self._check_directory(directory)
+        return future
+
+    def _on_event(self, directory: Path, name: str, mask: int) -> None:
+        """Завершение ожидания, когда файл получил окончательное имя."""
+        if not mask & (IN_MOVED_TO | IN_CLOSE_WRITE) or is_partial(name):
+            return
+        if directory in self._pending_dirs:
+            self._resolve_directory(directory, directory / name)
+        else:
+            self._resolve(directory / name)
+
+    def _resolve(self, path: Path) -> None:
+        """Завершение ожидания файла."""
+        if (future := self._pending.pop(path, None)) and not future.done():
+            future.set_result(path)
+
+    def _resolve_directory(self, directory: Path, path: Path) -> None:
+        """Завершение ожидания каталога загрузки."""
+        if self._watcher:
+            self._watcher.remove(directory)
+        if (future := self._pending_dirs.pop(directory, None)) and not future.done():
+            future.set_result(path)
+
+    def _check_directory(self, directory: Path) -> None:
+        """Проверка каталога загрузки, в нем не больше пары файлов."""
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file() and not is_partial(entry.name):
+                    self._resolve_directory(directory, Path(entry.path))
+                    return
+
+    async def _poll(self) -> None:
+        """Запасной вариант без inotify: проверка только ожидаемых файлов."""
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            for path in [path for path in self._pending if os.path.isfile(path)]:
+                self._resolve(path)
+            for directory in list(self._pending_dirs):
+                self._check_directory(directory)
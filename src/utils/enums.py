@@ -5,3 +5,21 @@ class ReleaseType(enum.Enum):
     FULL_RELEASE = "Полный выпуск"
     FRAGMENT_RELEASE = "Фрагмент"
     FESTIVAL_RELEASE = "Праздник"
+
+
+class SendPriority(enum.IntEnum):
+    INTERACTIVE = 0
+    NORMAL = 1
+    BACKGROUND = 2
+
+
+class ParserMode(str, enum.Enum):
+    HTTP = "http"
+    SELENIUM = "selenium"
+
+
+class LinkState(str, enum.Enum):
+    DISCOVERED = "discovered"
+    DOWNLOADING = "downloading"
+    DOWNLOADED = "downloaded"
+    PERSISTED = "persisted"
@@ -1,10 +1,17 @@
+import asyncio
 from pathlib import Path
 from typing import Optional
 
 from fluent_compiler.bundle import FluentBundle
-from fluentogram import FluentTranslator, TranslatorHub
+from fluentogram import FluentTranslator, TranslatorHub, TranslatorRunner
 
+from src.core.constants import I18N_RELOAD_DELAY, ROOT_LOCALE
+from src.core.exceptions import TranslationError
+from src.core.logger import logger
 from src.core.paths import LOCALES_DIR
+from src.services.watcher import DirectoryWatcher
+
+LOCALE_SUFFIX = ".ftl"
 
 
 class TranslationLoader:
@@ -15,58 +22,129 @@ class TranslationLoader:
     """
 
     def __init__(self, locales_folder: Path):
-        self.locales_folder = locales_folder
+        self.locales_folder = Path(locales_folder)
+
+    def get_locales(self) -> list[str]:
+        """Метод для получения списка языков, для которых есть файлы перевода."""
+        return sorted(
+            path.stem for path in self.locales_folder.glob(f"*{LOCALE_SUFFIX}")
+        )
 
     def get_content(self, locale: str) -> Optional[str]:
         """Метод для получения содержимого файла перевода для заданного языка."""
-        with open(self.locales_folder / f"{locale}.ftl", "r", encoding="utf-8") as f:
+        with open(
+            self.locales_folder / f"{locale}{LOCALE_SUFFIX}", "r", encoding="utf-8"
+        ) as f:
             return f.read()
 
 
 class FluentService:
-    """Предоставляет интерфейс для работы с переводами через TranslatorHub."""
+    """
+    Предоставляет интерфейс для работы с переводами через TranslatorHub.
+
+    Все языки из каталога переводов компилируются один раз, один TranslatorHub
+    используется всеми обновлениями. При включенном наблюдении за каталогом
+    изменения файлов перевода подхватываются без перезапуска бота:
+    новый TranslatorHub собирается целиком и подменяет старый одним присваиванием.
+    """
 
-    def __init__(self, loader, locales_map):
+    def __init__(self, loader: TranslationLoader, root_locale: str = ROOT_LOCALE):
         self._hub: Optional[TranslatorHub] = None
+        self._locales: frozenset[str] = frozenset()
         self.loader = loader
-        self.locales_map = locales_map
+        self.root_locale = root_locale
+        self._watcher: Optional[DirectoryWatcher] = None
+        self._reload_handle: Optional[asyncio.TimerHandle] = None
 
     @property
-    def hub(self):
+    def hub(self) -> TranslatorHub:
         """
         Свойство, возвращающее объект TranslatorHub.
-        Если TranslatorHub ещё не был инициализирован, он создаётся с указанными настройками.
+        Если TranslatorHub ещё не был собран, языки компилируются при первом обращении.
         """
         if not self._hub:
-            self._hub = TranslatorHub(
-                self.locales_map,
-                translators=[
-                    FluentTranslator(
-                        locale="ru",
-                        translator=FluentBundle.from_string(
-                            "ru-RU",
-                            self.loader.get_content("ru"),
-                            use_isolating=False,
-                        ),
-                    ),
-                ],
-                root_locale="ru",
-            )
+            self.load()
         return self._hub
 
-    def get_translator_by_locale(self, locale):
+    def load(self, strict: bool = False) -> None:
+        """
+        Компиляция всех языков каталога переводов и замена TranslatorHub.
+        Ошибки в файлах перевода логируются; при `strict` TranslatorHub не заменяется.
+        """
+        locales = self.loader.get_locales()
+        translators = []
+        for locale in locales:
+            bundle = FluentBundle.from_string(
+                locale, self.loader.get_content(locale), use_isolating=False
+            )
+            if errors := bundle.check_messages():
+                details = [error.args[0] for _, error in errors]
+                message = f"Ошибки в переводе {locale}: {details}"
+                if strict:
+                    raise TranslationError(message)
+                logger.warning(message)
+            translators.append(FluentTranslator(locale=locale, translator=bundle))
+        # недостающие сообщения берутся из основного языка
+        locales_map = {
+            locale: (
+                (locale,) if locale == self.root_locale else (locale, self.root_locale)
+            )
+            for locale in locales
+        }
+        self._hub = TranslatorHub(
+            locales_map, translators=translators, root_locale=self.root_locale
+        )
+        self._locales = frozenset(locales)
+        logger.info(f"Переводы загружены: {', '.join(locales)}")
+
+    def get_translator_by_locale(self, locale: Optional[str]) -> TranslatorRunner:
         """Метод для получения переводчика для заданного языка."""
-        if locale not in self.locales_map:
-            return self.hub.get_translator_by_locale(self.hub.root_locale)
-        return self.hub.get_translator_by_locale(locale)
+        hub = self.hub
+        # язык клиента приходит в виде "en" или "pt-br"
+        language = (locale or "").split("-", 1)[0].lower()
+        if language not in self._locales:
+            language = hub.root_locale
+        return hub.get_translator_by_locale(language)
+
+    def watch(self) -> None:
+        """Перезагрузка переводов при изменении файлов в каталоге."""
+        self._watcher = DirectoryWatcher(self._on_event)
+        self._watcher.add(self.loader.locales_folder)
+
+    def stop(self) -> None:
+        """Прекращение наблюдения за каталогом переводов."""
+        if self._reload_handle:
+            self._reload_handle.cancel()
+            self._reload_handle = None
+        if self._watcher:
+            self._watcher.close()
+            self._watcher = None
 
+    def _on_event(self, directory: Path, name: str, mask: int) -> None:
+        """Отложенная перезагрузка: редактор может записать файл в несколько приемов."""
+        if not name.endswith(LOCALE_SUFFIX):
+            return
+        if self._reload_handle:
+            self._reload_handle.cancel()
+        self._reload_handle = asyncio.get_running_loop().call_later(
+            I18N_RELOAD_DELAY, self._reload
+        )
 
-def configure_fluent():
+    def _reload(self) -> None:
+        """Перезагрузка переводов; при ошибке остаются прежние."""
+        self._reload_handle = None
+        try:
+            self.load(strict=True)
+        except (OSError, TranslationError) as e:
+            logger.error(f"Ошибка перезагрузки переводов, используются прежние: {e}")
+
+
+def configure_fluent() -> FluentService:
     """Функция для конфигурации и создания экземпляра FluentService."""
-    locales_map = {
-        "ru": ("ru",),
-    }
     loader = TranslationLoader(
         LOCALES_DIR,
     )
-    return FluentService(loader, locales_map)
+    return FluentService(loader)
+
+
+fluent = configure_fluent()
@@ -0,0 +1,130 @@
+from dataclasses import dataclass, field
+from html.parser import HTMLParser
+from typing import Optional
+from urllib.parse import urljoin
+
+
+@dataclass
+class Link:
+    """Ссылка на выпуск: текст и абсолютный адрес."""
+
+    text: str
+    href: str
+
+
+@dataclass
+class Form:
+    """HTML-форма: отправляемые поля и все именованные элементы управления."""
+
+    action: str
+    method: str = "get"
+    id: Optional[str] = None
+    fields: dict[str, str] = field(default_factory=dict)
+    controls: dict[str, str] = field(default_factory=dict)
+
+
+class PageScanner(HTMLParser):
+    """
+    Однопроходный разбор HTML-страницы сайта.
+
+    Собирает формы, ссылки внутри формы со списком выпусков
+    и текст элемента с кодом подтверждения загрузки.
+    """
+
+    def __init__(self, base_url: str, list_id: str = "list", code_id: str = "nekto"):
+        super().__init__(convert_charrefs=True)
+        self.base_url = base_url
+        self.list_id = list_id
+        self.code_id = code_id
+
+        self.forms: list[Form] = []
+        self.links: list[Link] = []
+        self.code: Optional[str] = None
+
+        self._form: Optional[Form] = None
+        self._list_tag: Optional[str] = None
+        self._list_depth = 0
+        self._link: Optional[tuple[str, list[str]]] = None
+        self._code_tag: Optional[str] = None
+        self._code_depth = 0
+        self._code_parts: list[str] = []
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, Optional[str]]]):
+        attributes = {name: value or "" for name, value in attrs}
+
+        if self._list_tag == tag:
+            self._list_depth += 1
+        elif self._list_tag is None and attributes.get("id") == self.list_id:
+            self._list_tag, self._list_depth = tag, 1
+
+        if self._code_tag == tag:
+            self._code_depth += 1
+        elif self._code_tag is None and attributes.get("id") == self.code_id:
+            self._code_tag, self._code_depth = tag, 1
+
+        match tag:
+            case "form":
+                self._form = Form(
+                    action=urljoin(self.base_url, attributes.get("action", "")),
+                    method=attributes.get("method", "get").lower(),
+                    id=attributes.get("id"),
+                )
+                self.forms.append(self._form)
+            case "input" | "button" | "textarea" if self._form and "name" in attributes:
+                self._add_control(tag, attributes)
+            case "a" if self._list_tag and "href" in attributes:
+                self._link = (urljoin(self.base_url, attributes["href"]), [])
+
+    def handle_endtag(self, tag: str):
+        if self._list_tag == tag:
+            self._list_depth -= 1
+            if not self._list_depth:
+                self._list_tag = None
+
+        if self._code_tag == tag:
+            self._code_depth -= 1
+            if not self._code_depth:
+                self.code = _normalize("".join(self._code_parts))
+                self._code_tag = None
+
+        match tag:
+            case "form":
+                self._form = None
+            case "a" if self._link:
+                href, parts = self._link
+                self.links.append(Link(text=_normalize("".join(parts)), href=href))
+                self._link = None
+
+    def handle_data(self, data: str):
+        if self._link:
+            self._link[1].append(data)
+        if self._code_tag:
+            self._code_parts.append(data)
+
+    def find_form(self, control: str) -> Optional[Form]:
+        """Поиск формы, содержащей элемент управления с заданным именем."""
+        return next((form for form in self.forms if control in form.controls), None)
+
+    def _add_control(self, tag: str, attributes: dict[str, str]) -> None:
+        """Регистрация поля формы."""
+        name, kind = attributes["name"], attributes.get("type", "text").lower()
+        self._form.controls[name] = attributes.get("value", "")
+        # кнопки отправляются только при клике, чекбоксы - только отмеченные
+        if tag == "button" or kind in ("submit", "image", "reset", "button"):
+            return
+        if kind in ("checkbox", "radio") and "checked" not in attributes:
+            return
+        self._form.fields[name] = attributes.get("value", "")
+
+
+def _normalize(text: str) -> str:
+    """Схлопывание пробельных символов, как в отображаемом тексте."""
+    return " ".join(text.split())
+
+
+def scan_page(html: str, base_url: str) -> PageScanner:
+    """Разбор HTML-страницы за один проход."""
+    scanner = PageScanner(base_url)
+    scanner.feed(html)
+    scanner.close()
+    return scanner
@@ -0,0 +1,150 @@
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+# битрейты, кбит/с: (версия MPEG 1 или 2, слой) -> таблица по индексу 1..14
+_BITRATES = {
+    (1, 1): (32, 64, 96, 128, 160, 192, 224, 256, 288, 320, 352, 384, 416, 448),
+    (1, 2): (32, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320, 384),
+    (1, 3): (32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    (2, 1): (32, 48, 56, 64, 80, 96, 112, 128, 144, 160, 176, 192, 224, 256),
+    (2, 2): (8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+    (2, 3): (8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+# частоты дискретизации по биту версии заголовка
+_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),  # MPEG 1
+    2: (22050, 24000, 16000),  # MPEG 2
+    0: (11025, 12000, 8000),  # MPEG 2.5
+}
+# доля данных, которая должна приходиться на корректные кадры
+MIN_AUDIO_COVERAGE = 0.9
+# сколько байт после сбоя просматривается в поисках следующего кадра
+RESYNC_WINDOW = 64 * 1024
+
+
+@dataclass
+class Frame:
+    """Заголовок кадра MPEG audio."""
+
+    offset: int
+    length: int
+    bitrate: int
+    sample_rate: int
+    samples: int
+
+
+@dataclass
+class AudioStream:
+    """Итог прохода по кадрам файла."""
+
+    frames: int = 0
+    samples: int = 0
+    sample_rate: int = 0
+    audio_bytes: int = 0
+    data_bytes: int = 0
+    truncated: bool = False
+
+    @property
+    def is_valid(self) -> bool:
+        """Файл целый: кадры найдены, покрывают данные и последний не обрезан."""
+        return (
+            self.frames > 0
+            and not self.truncated
+            and self.audio_bytes >= self.data_bytes * MIN_AUDIO_COVERAGE
+        )
+
+    @property
+    def duration(self) -> float:
+        """Длительность звучания, секунды."""
+        return self.samples / self.sample_rate if self.sample_rate else 0
+
+    @property
+    def bitrate(self) -> int:
+        """Средний битрейт по кадрам, бит/с (для VBR тоже)."""
+        duration = self.duration
+        return round(self.audio_bytes * 8 / duration) if duration else 0
+
+
+def parse_header(data: bytes | memoryview, offset: int) -> Optional[Frame]:
+    """Разбор заголовка кадра по смещению; None, если заголовка нет."""
+    if offset + 4 > len(data):
+        return None
+    b0, b1, b2 = data[offset], data[offset + 1], data[offset + 2]
+    if b0 != 0xFF or b1 & 0xE0 != 0xE0:
+        return None
+
+    version_bits = (b1 >> 3) & 0x03
+    layer = 4 - ((b1 >> 1) & 0x03)
+    bitrate_index = b2 >> 4
+    sample_rate_index = (b2 >> 2) & 0x03
+    if version_bits == 1 or layer == 4 or sample_rate_index == 3:
+        return None
+    if not 0 < bitrate_index < 15:
+        return None
+
+    version = 1 if version_bits == 3 else 2
+    bitrate = _BITRATES[version, layer][bitrate_index - 1] * 1000
+    sample_rate = _SAMPLE_RATES[version_bits][sample_rate_index]
+    padding = (b2 >> 1) & 0x01
+
+    if layer == 1:
+        samples = 384
+        length = (12 * bitrate // sample_rate + padding) * 4
+    else:
+        samples = 576 if layer == 3 and version == 2 else 1152
+        length = samples // 8 * bitrate // sample_rate + padding
+    return Frame(offset, length, bitrate, sample_rate, samples)
+
+
+def _audio_bounds(data: bytes | memoryview) -> tuple[int, int]:
+    """Границы аудиоданных без тегов ID3v2 в начале и ID3v1 в конце."""
+    start, end = 0, len(data)
+    if bytes(data[:3]) == b"ID3" and end >= 10:
+        size = 0
+        for byte in data[6:10]:
+            size = (size << 7) | (byte & 0x7F)
+        footer = 10 if data[5] & 0x10 else 0
+        start = min(end, 10 + size + footer)
+    if end - start >= 128 and bytes(data[end - 128 : end - 125]) == b"TAG":
+        end -= 128
+    return start, end
+
+
+def _resync(data: bytes | memoryview, offset: int, end: int) -> Optional[int]:
+    """Поиск следующего кадра после поврежденного участка."""
+    window_end = min(end, offset + RESYNC_WINDOW)
+    for position in range(offset + 1, window_end - 3):
+        frame = parse_header(data, position)
+        # совпадение засчитывается, только если за кадром идет следующий
+        if frame and parse_header(data, position + frame.length):
+            return position
+    return None
+
+
+def iter_frames(data: bytes | memoryview) -> Iterator[Frame]:
+    """Последовательный обход кадров аудиоданных."""
+    offset, end = _audio_bounds(data)
+    while offset + 4 <= end:
+        frame = parse_header(data, offset)
+        if frame is None:
+            if (offset := _resync(data, offset, end)) is None:
+                return
+            continue
+        yield frame
+        offset += frame.length
+
+
+def scan(data: bytes | memoryview) -> AudioStream:
+    """Проход по всем кадрам с подсчетом длительности и проверкой целостности."""
+    start, end = _audio_bounds(data)
+    stream = AudioStream(data_bytes=end - start)
+    for frame in iter_frames(data):
+        stream.frames += 1
+        stream.samples += frame.samples
+        stream.sample_rate = stream.sample_rate or frame.sample_rate
+        if frame.offset + frame.length > end:
+            stream.truncated = True
+            stream.audio_bytes += end - frame.offset
+        else:
+            stream.audio_bytes += frame.length
+    return stream
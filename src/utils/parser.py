@@ -2,14 +2,19 @@ import asyncio
 import logging
 import os
 import re
+import time
 from datetime import datetime, date
 from pathlib import Path
 from typing import Optional, Dict, Any
 
 from selenium import webdriver
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    TimeoutException,
+    WebDriverException,
+)
 from selenium.webdriver import Keys
 from selenium.webdriver.common.by import By
-from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.chrome.service import Service
@@ -17,11 +22,13 @@ from tqdm import tqdm
 from tqdm.asyncio import tqdm_asyncio
 from webdriver_manager.chrome import ChromeDriverManager
 
+from src.core.config import settings
 from src.core.constants import (
-    START_URL,
-    PAUSE_DURATION_SECONDS,
     DOWNLOAD_WAIT_TIMEOUT,
     DRIVER_TIMEOUT,
+    DB_WRITE_RETRIES,
+    MAILING_MAX_EPISODES,
+    MAX_LINK_ATTEMPTS,
 )
 
 from src.core.paths import BROADCASTS_DIR
@@ -32,10 +39,22 @@ from src.core.exceptions import (
     FileManagerError,
     PageParsingError,
     DownloadTimeoutError,
+    DownloadError,
 )
 from src.database.connect import async_session_pool
+from src.database.repo.broadcast import CatalogKey
 from src.database.repo.requests import RequestsRepo
-from src.utils.enums import ReleaseType
+from src.services.downloader import HttpDownloader
+from src.services.catalog import catalog
+from src.services.content_index import ContentIndexer
+from src.services.journal import CrawlJournal
+from src.services.manifest import DownloadManifest, DownloadRecord
+from src.services.ratelimit import HostLimiter
+from src.services.storage_report import get_storage_report
+from src.services.transcoder import Transcoder
+from src.services.watcher import DownloadTracker
+from src.utils.enums import ReleaseType, ParserMode, LinkState
+from src.utils.html_parser import Link, scan_page
 
 logger = logging.getLogger(__name__)
 
@@ -48,24 +67,30 @@ class WebDriverManager:
 
     async def __aenter__(self) -> webdriver.Chrome:
         """Инициализация и настройка веб-драйвера."""
-        try:
-            service = Service(executable_path=ChromeDriverManager().install())
-            chrome_options = self._configure_chrome_options()
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            return self.driver
-        except Exception as e:
-            raise WebDriverError(f"Ошибка при инициализации веб-драйвера: {e}") from e
+        self.driver = await asyncio.to_thread(self.create_driver)
+        return self.driver
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Гарантированное закрытие драйвера"""
         if self.driver:
-            self.driver.quit()
+            await asyncio.to_thread(self.driver.quit)
+
+    @classmethod
+    def create_driver(cls) -> webdriver.Chrome:
+        """Создание веб-драйвера (блокирующий вызов)."""
+        try:
+            service = Service(executable_path=ChromeDriverManager().install())
+            chrome_options = cls._configure_chrome_options()
+            return webdriver.Chrome(service=service, options=chrome_options)
+        except Exception as e:
+            raise WebDriverError(f"Ошибка при инициализации веб-драйвера: {e}") from e
 
     @staticmethod
     def _configure_chrome_options() -> webdriver.ChromeOptions:
         """Конфигурация опций Chrome."""
         chrome_options = webdriver.ChromeOptions()
-        # chrome_options.add_argument("--headless=new")
+        if settings.PARSER.HEADLESS:
+            chrome_options.add_argument("--headless=new")
         # chrome_options.add_argument("--no-sandbox")
         # chrome_options.add_argument("--disable-dev-shm-usage")
 
@@ -78,6 +103,51 @@ class WebDriverManager:
         return chrome_options
 
 
+class WebDriverPool:
+    """
+    Пул веб-драйверов для параллельной обработки ссылок.
+
+    Драйверы создаются и закрываются в отдельных потоках,
+    упавший драйвер заменяется новым через `recycle`.
+    """
+
+    def __init__(self, size: int = settings.PARSER.WORKERS):
+        self.size = size
+        self.drivers: list[webdriver.Chrome] = []
+
+    async def __aenter__(self) -> "WebDriverPool":
+        results = await asyncio.gather(
+            *(asyncio.to_thread(WebDriverManager.create_driver) for _ in range(self.size)),
+            return_exceptions=True,
+        )
+        self.drivers = [r for r in results if not isinstance(r, BaseException)]
+        if not self.drivers:
+            raise results[0]
+        if len(self.drivers) < self.size:
+            logger.warning(f"Запущено драйверов: {len(self.drivers)} из {self.size}")
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Гарантированное закрытие всех драйверов"""
+        await asyncio.gather(
+            *(asyncio.to_thread(self._quit, driver) for driver in self.drivers)
+        )
+
+    async def recycle(self, index: int) -> webdriver.Chrome:
+        """Замена упавшего драйвера новым."""
+        await asyncio.to_thread(self._quit, self.drivers[index])
+        self.drivers[index] = await asyncio.to_thread(WebDriverManager.create_driver)
+        return self.drivers[index]
+
+    @staticmethod
+    def _quit(driver: webdriver.Chrome) -> None:
+        """Закрытие драйвера без ошибок для уже упавшего браузера."""
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"Ошибка при закрытии драйвера: {e}")
+
+
 class LinkProcessor:
     """Обработка текста ссылки для извлечения данных."""
 
@@ -86,19 +156,57 @@ class LinkProcessor:
     )
 
     @classmethod
-    async def process_link(cls, link_text: str) -> Optional[Dict[str, Any]]:
-        """Парсинг информации из текста ссылки."""
-        try:
-            await asyncio.sleep(PAUSE_DURATION_SECONDS)
-            if not (link_data := cls._LINK_PATTERN.match(link_text)):
-                raise ValueError(f"Invalid link format: {link_text}")
-            return link_data.groupdict()
-        except Exception as e:
-            raise LinkProcessingError(f"Ошибка при обработке ссылки: {e}") from e
+    def parse(cls, link_text: str) -> Dict[str, Any]:
+        """Разбор текста ссылки регулярным выражением."""
+        if not (link_data := cls._LINK_PATTERN.match(link_text)):
+            raise LinkProcessingError(
+                f"Ошибка при обработке ссылки: Invalid link format: {link_text}"
+            )
+        return link_data.groupdict()
+
+    @classmethod
+    def parse_links(cls, links: list[Link]) -> list[tuple[Link, Dict[str, Any]]]:
+        """Разбор текстов всех ссылок страницы за один проход."""
+        match = cls._LINK_PATTERN.match
+        parsed = []
+        for link in links:
+            if link_data := match(link.text):
+                parsed.append((link, link_data.groupdict()))
+            else:
+                logger.error(f"Ошибка обработки ссылки: Invalid link format: {link.text}")
+        return parsed
 
 
 class DatabaseManager:
-    """Управление операциями с базой данных."""
+    """
+    Управление операциями с базой данных.
+
+    Разобранные выпуски копятся в буфере и записываются пакетами
+    по `batch_size` записей, одна транзакция на пакет.
+    При ошибке повторяется только пакет, который не удалось записать.
+    """
+
+    def __init__(
+        self,
+        repo: RequestsRepo,
+        batch_size: int = settings.PARSER.BATCH_SIZE,
+        retries: int = DB_WRITE_RETRIES,
+        journal: Optional[CrawlJournal] = None,
+    ):
+        self._repo = repo
+        self.batch_size = batch_size
+        # пакет записывается хотя бы одной попыткой
+        self.retries = max(retries, 1)
+        self.journal = journal
+        self._buffer: list[tuple[Optional[str], Dict[str, Any]]] = []
+        self._lock = asyncio.Lock()
+
+    async def __aenter__(self) -> "DatabaseManager":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Запись оставшихся в буфере выпусков"""
+        await self.flush()
 
     @staticmethod
     async def _parse_release_date(date_str: str) -> date | None:
@@ -109,136 +217,288 @@ class DatabaseManager:
             return None
 
     @classmethod
-    async def save_broadcast_data(
-        cls, link_data: Dict[str, Any], repo: RequestsRepo
-    ) -> None:
-        """Сохранение данных трансляции в БД."""
-        try:
-            data = {
-                "role_name": link_data["role_name"],
-                "release_type": ReleaseType.FULL_RELEASE,
-                "filename": link_data["filename"],
-                "comment": None,
-            }
-
-            if release_type := link_data.get("release_type"):
-                data["release_type"] = ReleaseType(release_type.title()).name
-
-            if release_date := await cls._parse_release_date(link_data["release_date"]):
-                data["release_date"] = release_date
-            else:
-                data["comment"] = link_data["release_date"]
-
-            await repo.broadcasts.create(data)
-            await repo.session.commit()
-        except Exception as e:
-            await repo.session.rollback()
-            raise DatabaseError(f"Ошибка при сохранении данных: {e}") from e
+    async def build_broadcast_data(cls, link_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Подготовка полей выпуска из данных ссылки."""
+        data = {
+            "role_name": link_data["role_name"],
+            "release_type": ReleaseType.FULL_RELEASE,
+            "filename": link_data.get("filename"),
+            "release_date": None,
+            "comment": None,
+        }
 
+        if release_type := link_data.get("release_type"):
+            data["release_type"] = ReleaseType(release_type.title())
 
-class FileManager:
-    """Управление операциями с файлами."""
+        if release_date := await cls._parse_release_date(link_data["release_date"]):
+            data["release_date"] = release_date
+        else:
+            data["comment"] = link_data["release_date"]
+        return data
 
     @staticmethod
-    async def get_latest_downloaded_file(
-        directory: Path, extension: str = ".crdownload"
-    ) -> Optional[str]:
-        """Получение последнего скачанного файла."""
-        try:
-            files = os.listdir(directory)
+    def get_broadcast_key(data: Dict[str, Any]) -> CatalogKey:
+        """Ключ выпуска в каталоге: (дата или комментарий, тип, роль)."""
+        return (
+            data.get("release_date") or data["comment"],
+            data["release_type"],
+            data["role_name"],
+        )
+
+    async def add(self, link_data: Dict[str, Any]) -> None:
+        """Добавление выпуска в буфер с записью пакета при заполнении."""
+        self._buffer.append(
+            (link_data.get("url"), await self.build_broadcast_data(link_data))
+        )
+        if len(self._buffer) >= self.batch_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Запись буфера в БД одной транзакцией с повторами при ошибке."""
+        async with self._lock:
+            await self._write_batch()
+
+    async def _write_batch(self) -> None:
+        """Запись накопленного пакета."""
+        batch, self._buffer = self._buffer, []
+        if not batch:
+            return
+
+        last_error: Optional[Exception] = None
+        for attempt in range(1, self.retries + 1):
+            try:
+                await self._repo.broadcasts.bulk_create([data for _, data in batch])
+                catalog.invalidate()
+                if self.journal:
+                    self.journal.record_many(
+                        [url for url, _ in batch if url], LinkState.PERSISTED
+                    )
+                return
+            except Exception as e:
+                await self._repo.session.rollback()
+                logger.warning(
+                    f"Ошибка записи пакета ({len(batch)} выпусков), "
+                    f"попытка {attempt}/{self.retries}: {e}"
+                )
+                last_error = e
+                await asyncio.sleep(attempt)
+
+        raise DatabaseError(
+            f"Ошибка при сохранении пакета из {len(batch)} выпусков: {last_error}"
+        )
 
-            if not files:
-                return None
-            latest_file = max(
-                [os.path.join(directory, f) for f in files if f.endswith(extension)],
-                key=os.path.getctime,
+
+async def select_links(
+    links: list[Link],
+    repo: RequestsRepo,
+    incremental: bool,
+    journal: CrawlJournal,
+) -> list[tuple[Link, Dict[str, Any]]]:
+    """
+    Отбор ссылок для загрузки.
+
+    В инкрементальном режиме пропускаются выпуски, уже сохраненные в каталоге,
+    и повторы внутри самой страницы, поэтому загружаются только новые выпуски.
+    Ссылки, сохраненные прерванным запуском, пропускаются по журналу.
+    """
+    known: set[CatalogKey] = (
+        await repo.broadcasts.get_catalog_keys() if incremental else set()
+    )
+    selected = []
+    for link, link_data in LinkProcessor.parse_links(links):
+        try:
+            key = DatabaseManager.get_broadcast_key(
+                await DatabaseManager.build_broadcast_data(link_data)
             )
-            filename = os.path.basename(latest_file)
-            return filename.removesuffix(extension)
         except Exception as e:
-            raise FileManagerError(f"Ошибка получения файла: {e}") from e
+            logger.error(f"Ошибка обработки ссылки {link.text}: {e}")
+            continue
+        if incremental and key in known:
+            continue
+        if journal.state(link.href) is LinkState.PERSISTED:
+            continue
+        known.add(key)
+        link_data["url"] = link.href
+        selected.append((link, link_data))
+
+    journal.record_many(
+        [link.href for link, _ in selected if journal.state(link.href) is None],
+        LinkState.DISCOVERED,
+    )
+    if incremental:
+        logger.info(f"Новых выпусков: {len(selected)} из {len(links)}")
+    return selected
 
-    @classmethod
-    async def wait_for_downloads(cls, timeout: int = DOWNLOAD_WAIT_TIMEOUT) -> None:
-        """Ожидание завершения загрузки файлов с прогресс-баром."""
-        start_time = datetime.now()
-        with tqdm(
-            total=timeout,
-            desc="Ожидание загрузок",
-            unit="s",
-            bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} сек.",
-        ) as pbar:
-            while any(f.endswith(".crdownload") for f in os.listdir(BROADCASTS_DIR)):
-                if (datetime.now() - start_time).seconds > timeout:
-                    raise DownloadTimeoutError("Превышено время ожидания загрузки")
-                await asyncio.sleep(1)
-                pbar.update(1)
 
+def recover_download(
+    journal: CrawlJournal, url: str, directory: Path
+) -> Optional[str]:
+    """Файл, загруженный прерванным запуском, если он на месте."""
+    if journal.state(url) is not LinkState.DOWNLOADED:
+        return None
+    filename = journal.get(url, "filename")
+    if filename and os.path.isfile(Path(directory) / filename):
+        return filename
+    return None
 
 
 class PageParser:
-    """Парсинг страницы и обработка всех ссылок."""
-
-    def __init__(self, driver: webdriver.Chrome):
-        self.driver = driver
-        self.wait = WebDriverWait(driver, DRIVER_TIMEOUT)
+    """
+    Парсинг страницы и обработка ссылок пулом веб-драйверов.
+
+    Ссылки раздаются воркерам через очередь, по одному воркеру на драйвер.
+    Блокирующие вызовы Selenium выполняются в отдельных потоках.
+    """
+
+    def __init__(
+        self,
+        pool: WebDriverPool,
+        tracker: DownloadTracker,
+        journal: CrawlJournal,
+        incremental: bool = True,
+        host_limiter: Optional[HostLimiter] = None,
+    ):
+        self.pool = pool
+        self.tracker = tracker
+        self.journal = journal
+        self.incremental = incremental
+        self.host_limiter = host_limiter or HostLimiter(
+            settings.PARSER.HOST_CONCURRENCY
+        )
+        self.manifest = DownloadManifest(tracker.directory)
         self.progress_bar: Optional[tqdm] = None
+        self._saves: list[asyncio.Task] = []
 
-    async def _click_show_roles(self) -> None:
+    @staticmethod
+    def _click_show_roles(wait: WebDriverWait) -> None:
         """Клик по кнопке показа ролей."""
-        show_roles_button = self.wait.until(
-            EC.element_to_be_clickable((By.NAME, "show"))
-        )
+        show_roles_button = wait.until(EC.element_to_be_clickable((By.NAME, "show")))
         show_roles_button.click()
 
-    async def _get_all_links(self) -> list[WebElement]:
-        """Получение всех ссылок в форме."""
-        form_release = self.wait.until(EC.presence_of_element_located((By.ID, "list")))
-        return form_release.find_elements(By.TAG_NAME, "a")
-
-    async def _process_single_link(self, link, repo: RequestsRepo) -> None:
-        """Обработка одной ссылки."""
-        link_text = link.text.strip()
-        try:
-            link_data = await LinkProcessor.process_link(link_text)
-            if not link_data:
+    def _get_all_links(self, driver: webdriver.Chrome) -> list[Link]:
+        """
+        Получение всех ссылок в форме (блокирующий вызов).
+        HTML страницы забирается один раз и разбирается локально,
+        без обращений к драйверу за каждой ссылкой.
+        """
+        wait = WebDriverWait(driver, DRIVER_TIMEOUT)
+        driver.get(settings.PARSER.START_URL)
+        self._click_show_roles(wait)
+
+        wait.until(EC.presence_of_element_located((By.ID, "list")))
+        return scan_page(driver.page_source, driver.current_url).links
+
+    async def _worker(
+        self, index: int, queue: asyncio.Queue, db: DatabaseManager
+    ) -> None:
+        """Обработка очереди ссылок на одном драйвере пула."""
+        while True:
+            try:
+                link, link_data, attempt = queue.get_nowait()
+            except asyncio.QueueEmpty:
                 return
 
-            await self._download_file(link.get_attribute("href"))
-
-            if filename := await FileManager.get_latest_downloaded_file(BROADCASTS_DIR):
+            if filename := recover_download(
+                self.journal, link.href, self.tracker.directory
+            ):
                 link_data["filename"] = filename
-                await DatabaseManager.save_broadcast_data(link_data, repo)
+                await db.add(link_data)
+                self.progress_bar.update(1)
+                continue
+
+            # Chrome не докачивает файлы, поэтому загрузка начинается заново
+            record = self.manifest.start(link.href, clean=True)
+            self.journal.record(link.href, LinkState.DOWNLOADING)
+            try:
+                async with self.host_limiter(link.href):
+                    await asyncio.to_thread(
+                        self._download_file,
+                        self.pool.drivers[index],
+                        link.href,
+                        record.staging_dir,
+                    )
+            except (TimeoutException, NoSuchElementException) as e:
+                self.manifest.discard(record)
+                logger.error(f"Ошибка обработки ссылки {link.text}: {e}")
+            except WebDriverException as e:
+                self.manifest.discard(record)
+                logger.warning(f"Драйвер {index} перезапускается после ошибки: {e}")
+                await self.pool.recycle(index)
+                if attempt < MAX_LINK_ATTEMPTS:
+                    queue.put_nowait((link, link_data, attempt + 1))
+                    continue
+                logger.error(f"Ссылка {link.text} пропущена после {attempt} попыток")
+            else:
+                self._saves.append(
+                    asyncio.create_task(
+                        self._save_when_downloaded(record, link_data, db)
+                    )
+                )
 
-        except Exception as e:
-            logger.error(f"Ошибка обработки ссылки {link_text}: {e}")
+            self.progress_bar.update(1)
+
+    async def _save_when_downloaded(
+        self, record: DownloadRecord, link_data: Dict[str, Any], db: DatabaseManager
+    ) -> None:
+        """Ожидание загрузки файла выпуска и его запись в БД."""
+        try:
+            staged_path = await asyncio.wait_for(
+                self.tracker.wait_for_any(record.staging_dir), DOWNLOAD_WAIT_TIMEOUT
+            )
+            link_data["filename"] = self.manifest.complete(record, staged_path)
+            self.journal.record(
+                record.url, LinkState.DOWNLOADED, filename=link_data["filename"]
+            )
+            await db.add(link_data)
+        except asyncio.TimeoutError:
+            self.manifest.discard(record)
+            logger.error(
+                f"{DownloadTimeoutError.__name__}: "
+                f"превышено время ожидания загрузки {record.url}"
+            )
+        except (FileManagerError, DatabaseError) as e:
+            logger.error(e)
 
     async def parse_page(self) -> None:
         """Основной метод парсинга страницы с прогресс-баром."""
         try:
-            self.driver.get(START_URL)
-            await self._click_show_roles()
+            async with self.host_limiter(settings.PARSER.START_URL):
+                links = await asyncio.to_thread(
+                    self._get_all_links, self.pool.drivers[0]
+                )
 
             async with async_session_pool() as session:
                 repo = RequestsRepo(session)
-                links = await self._get_all_links()
+                jobs = await select_links(links, repo, self.incremental, self.journal)
+                # дальше сессия только пишет: соединение не занято на время загрузок
+                await session.commit()
+
+                queue: asyncio.Queue = asyncio.Queue()
+                for link, link_data in jobs:
+                    queue.put_nowait((link, link_data, 1))
 
                 # Инициализация прогресс-бара
                 self.progress_bar = tqdm_asyncio(
-                    total=len(links),
+                    total=len(jobs),
                     desc="Обработка ссылок",
                     unit="ссылка",
                     colour="GREEN",
                     bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]",
                 )
-                count = 0
-                for link in links:
-                    await self._process_single_link(link, repo)
-                    self.progress_bar.update(1)
-                    await asyncio.sleep(PAUSE_DURATION_SECONDS)
-                    count += 1
-                    if count == 5:
-                        break
+                self.manifest.cleanup()
+                async with DatabaseManager(repo, journal=self.journal) as db:
+                    results = await asyncio.gather(
+                        *(
+                            self._worker(index, queue, db)
+                            for index in range(len(self.pool.drivers))
+                        ),
+                        return_exceptions=True,
+                    )
+                    for error in filter(None, results):
+                        logger.error(f"Воркер остановлен: {error}")
+                    if not queue.empty():
+                        logger.error(f"Не обработано ссылок: {queue.qsize()}")
+                    await asyncio.gather(*self._saves)
 
         except Exception as e:
             raise PageParsingError(f"Ошибка парсинга: {e}") from e
@@ -246,35 +506,180 @@ class PageParser:
             if self.progress_bar:
                 self.progress_bar.close()
 
-    async def _download_file(self, url: str) -> None:
-        """Загрузка файла по ссылке."""
+    @staticmethod
+    def _download_file(
+        driver: webdriver.Chrome, url: str, download_dir: Path
+    ) -> None:
+        """Загрузка файла по ссылке в отдельный каталог (блокирующий вызов)."""
+        wait = WebDriverWait(driver, DRIVER_TIMEOUT)
+        driver.execute_cdp_cmd(
+            "Page.setDownloadBehavior",
+            {"behavior": "allow", "downloadPath": str(download_dir)},
+        )
+        driver.get(url)
+
+        code_element = wait.until(EC.presence_of_element_located((By.ID, "nekto")))
+        input_field = wait.until(EC.presence_of_element_located((By.NAME, "code")))
+        input_field.send_keys(f"{code_element.text}{Keys.ENTER}")
+
+        # загрузка должна начаться до того, как драйвер перейдет к следующей ссылке
+        wait.until(lambda _: os.listdir(download_dir))
+
+
+class HttpPageParser:
+    """Парсинг страницы и параллельная загрузка выпусков по HTTP."""
+
+    def __init__(
+        self,
+        downloader: HttpDownloader,
+        journal: CrawlJournal,
+        start_url: Optional[str] = None,
+        incremental: bool = True,
+    ):
+        self.downloader = downloader
+        self.journal = journal
+        self.start_url = start_url or settings.PARSER.START_URL
+        self.incremental = incremental
+        self.progress_bar: Optional[tqdm] = None
+
+    async def _download_link(
+        self, link: Link, link_data: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Загрузка выпуска по ссылке (или восстановление после прерванного запуска)."""
         try:
-            original_window = self.driver.current_window_handle
-            self.driver.switch_to.new_window("tab")
-            self.driver.get(url)
+            if filename := recover_download(
+                self.journal, link.href, self.downloader.directory
+            ):
+                link_data["filename"] = filename
+                return link_data
 
-            code_element = self.wait.until(
-                EC.presence_of_element_located((By.ID, "nekto"))
-            )
-            input_field = self.wait.until(
-                EC.presence_of_element_located((By.NAME, "code"))
+            self.journal.record(link.href, LinkState.DOWNLOADING)
+            link_data["filename"] = await self.downloader.download(link.href)
+            self.journal.record(
+                link.href, LinkState.DOWNLOADED, filename=link_data["filename"]
             )
+            return link_data
+        except Exception as e:
+            logger.error(f"Ошибка обработки ссылки {link.text}: {e}")
+            return None
+
+    async def parse_page(self) -> None:
+        """Основной метод парсинга: загрузки идут параллельно, запись в БД - по мере готовности."""
+        try:
+            page = await self.downloader.fetch_index(self.start_url)
+
+            async with async_session_pool() as session:
+                repo = RequestsRepo(session)
+                links = await select_links(
+                    page.links, repo, self.incremental, self.journal
+                )
+                # дальше сессия только пишет: соединение не занято на время загрузок
+                await session.commit()
+                # недокачанные файлы прерванного запуска будут докачаны
+                self.downloader.manifest.cleanup(
+                    keep=self.journal.urls(LinkState.DOWNLOADING)
+                )
+                self.progress_bar = tqdm_asyncio(
+                    total=len(links),
+                    desc="Обработка ссылок",
+                    unit="ссылка",
+                    colour="GREEN",
+                    bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}]",
+                )
+                tasks = [
+                    asyncio.create_task(self._download_link(link, link_data))
+                    for link, link_data in links
+                ]
+                try:
+                    async with DatabaseManager(repo, journal=self.journal) as db:
+                        for task in asyncio.as_completed(tasks):
+                            if link_data := await task:
+                                try:
+                                    await db.add(link_data)
+                                except DatabaseError as e:
+                                    logger.error(e)
+                            self.progress_bar.update(1)
+                finally:
+                    for task in tasks:
+                        task.cancel()
 
-            input_field.send_keys(f"{code_element.text}{Keys.ENTER}")
-            await asyncio.sleep(PAUSE_DURATION_SECONDS)
-            self.driver.close()
-            self.driver.switch_to.window(original_window)
         except Exception as e:
-            raise PageParsingError(f"Ошибка загрузки файла: {e}") from e
+            raise PageParsingError(f"Ошибка парсинга: {e}") from e
+        finally:
+            if self.progress_bar:
+                self.progress_bar.close()
 
 
-async def run_parser() -> None:
-    """Основная функция для запуска парсера."""
+def parse_snapshot(
+    path: Path, base_url: Optional[str] = None
+) -> list[tuple[Link, Dict[str, Any]]]:
+    """
+    Разбор сохраненной главной страницы без браузера и сети.
+    Позволяет проверить и замерить извлечение каталога офлайн.
+    """
+    start_time = time.perf_counter()
+    content = Path(path).read_bytes()
+    try:
+        html = content.decode("utf-8")
+    except UnicodeDecodeError:
+        html = content.decode("cp1251")
+
+    page = scan_page(html, base_url or settings.PARSER.START_URL)
+    links = LinkProcessor.parse_links(page.links)
+    logger.info(
+        f"Снимок {path}: ссылок {len(page.links)}, разобрано {len(links)} "
+        f"за {time.perf_counter() - start_time:.3f} с"
+    )
+    return links
+
+
+async def run_parser(
+    mode: Optional[ParserMode] = None, incremental: Optional[bool] = None
+) -> None:
+    """
+    Основная функция для запуска парсера.
+    Прогресс пишется в журнал, поэтому прерванный запуск продолжается с места сбоя.
+
+    По умолчанию выпуски загружаются по HTTP, режим Selenium
+    остается запасным вариантом (`PARSER_MODE=selenium` или `--mode selenium`).
+    Инкрементальный режим загружает только выпуски, которых еще нет в каталоге.
+    """
+    mode = mode or settings.PARSER.MODE
+    if incremental is None:
+        incremental = settings.PARSER.INCREMENTAL
     try:
-        async with WebDriverManager() as driver:
-            parser = PageParser(driver)
-            await parser.parse_page()
-            await FileManager.wait_for_downloads()
+        async with async_session_pool() as session:
+            last_broadcast_id = await RequestsRepo(session).broadcasts.get_last_id()
+
+        with CrawlJournal() as journal:
+            if mode is ParserMode.HTTP:
+                async with HttpDownloader() as downloader:
+                    parser = HttpPageParser(
+                        downloader, journal, incremental=incremental
+                    )
+                    await parser.parse_page()
+            else:
+                async with (
+                    WebDriverPool() as pool,
+                    DownloadTracker(BROADCASTS_DIR) as tracker,
+                ):
+                    parser = PageParser(pool, tracker, journal, incremental=incremental)
+                    await parser.parse_page()
+            journal.compact()
+
+        await ContentIndexer().run(async_session_pool)
+        if settings.TRANSCODE.ENABLED:
+            await Transcoder().run(async_session_pool)
+        logger.info(f"Хранилище выпусков: {await get_storage_report(async_session_pool)}")
+
+        # первое заполнение каталога не рассылается
+        if settings.TELEGRAM.MAILING and last_broadcast_id is not None:
+            async with async_session_pool() as session:
+                created = await RequestsRepo(session).mailings.create_for_new_broadcasts(
+                    last_broadcast_id, MAILING_MAX_EPISODES
+                )
+            if created:
+                logger.info(f"Создано рассылок новых выпусков: {created}")
 
     except (
         WebDriverError,
@@ -283,6 +688,7 @@ async def run_parser() -> None:
         FileManagerError,
         PageParsingError,
         DownloadTimeoutError,
+        DownloadError,
     ) as e:
         logger.error(f"{e.__class__.__name__}: {e}")
     except Exception as e:
@@ -0,0 +1,36 @@
+import hashlib
+
+FEISTEL_ROUNDS = 4
+
+
+def _round_function(value: int, seed: int, round_index: int, bits: int) -> int:
+    """Раундовая функция сети Фейстеля, зависящая от ключа."""
+    digest = hashlib.blake2b(
+        value.to_bytes(8, "little"),
+        digest_size=8,
+        key=seed.to_bytes(8, "little") + bytes([round_index]),
+    ).digest()
+    return int.from_bytes(digest, "little") & ((1 << bits) - 1)
+
+
+def permute(index: int, size: int, seed: int) -> int:
+    """
+    Элемент с номером `index` в псевдослучайной перестановке чисел 0..size-1.
+
+    Перестановка задается ключом `seed` и не хранится: сеть Фейстеля
+    переставляет числа диапазона степени двойки, а значения за пределами
+    `size` пропускаются (cycle walking). Время и память - O(1).
+    """
+    if not 0 <= index < size:
+        raise ValueError(f"Номер {index} вне перестановки из {size} элементов")
+
+    half_bits = max(1, ((size - 1).bit_length() + 1) // 2)
+    mask = (1 << half_bits) - 1
+    value = index
+    while True:
+        left, right = value >> half_bits, value & mask
+        for round_index in range(FEISTEL_ROUNDS):
+            left, right = right, left ^ _round_function(right, seed, round_index, half_bits)
+        value = (left << half_bits) | right
+        if value < size:
+            return value
@@ -0,0 +1,33 @@
+import asyncio
+from typing import Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Объединение одновременных вызовов с одинаковым ключом.
+
+    Пока вызов с ключом выполняется, остальные вызывающие ждут его результат
+    вместо повторного выполнения. Вызов идет в отдельной задаче, поэтому
+    отмена первого вызывающего не прерывает его для остальных.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Task] = {}
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._calls
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """
+        Выполнение `func` один раз на ключ.
+        Возвращает результат и признак того, что он получен чужим вызовом.
+        """
+        task = self._calls.get(key)
+        shared = task is not None
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(task), shared